@@ -11,8 +11,7 @@ top-level modules with `__init__.py` exposing `bl_info`).
 from __future__ import annotations
 
 import argparse
-import shutil
-import tempfile
+import os
 import tomllib
 import zipfile
 from pathlib import Path
@@ -41,23 +40,18 @@ def build(zip_name: str | None = None) -> Path:
         zip_name = f"eve_frontier_visualizer-{version}.zip"
     out_path = DIST_DIR / zip_name
 
-    # Create a temp staging dir that mirrors the final expected layout:
+    if out_path.exists():
+        out_path.unlink()
+    # Stream straight from the package tree into the archive (no staging copy):
     # zip root contains eve_frontier_visualizer/*
-    with tempfile.TemporaryDirectory() as tmpd:
-        staging_root = Path(tmpd)
-        addon_target = staging_root / DIST_PACKAGE_NAME
-        shutil.copytree(PKG_ROOT, addon_target, dirs_exist_ok=True)
-        for cache in addon_target.rglob("__pycache__"):
-            shutil.rmtree(cache, ignore_errors=True)
-        if out_path.exists():
-            out_path.unlink()
-        # Manually zip to avoid race on Windows with shutil.make_archive/stat
-        with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-            for p in addon_target.rglob("*"):
-                if p.is_dir():
-                    continue
-                rel = p.relative_to(staging_root)
-                zf.write(p, rel.as_posix())
+    # Manually zip to avoid race on Windows with shutil.make_archive/stat
+    with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for dirpath, dirnames, filenames in os.walk(PKG_ROOT):
+            # Prune caches in place so os.walk never descends into them
+            dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+            rel_dir = Path(dirpath).relative_to(PKG_ROOT)
+            for name in sorted(filenames):
+                zf.write(Path(dirpath) / name, (DIST_PACKAGE_NAME / rel_dir / name).as_posix())
     return out_path
 
 
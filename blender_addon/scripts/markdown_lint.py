@@ -10,63 +10,75 @@ Exit code: 0 if no issues, 1 otherwise.
 
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List
 
 MARKDOWN_EXTS = {".md", ".markdown", ".mdown"}
 
-FENCE_RE = re.compile(r"^```")
-OL_ITEM_RE = re.compile(r"^(\s*)(\d+)\.\s+")
-UL_ITEM_RE = re.compile(r"^(\s*)[-*+]\s+")
+# Single-pass line classifier: fence, ordered item (``num`` group) or unordered item.
+LINE_RE = re.compile(r"^(?:(?P<fence>```)|\s*(?:(?P<num>\d+)\.|[-*+])\s+)")
 
 
 SKIP_DIR_NAMES = {".venv", "venv", ".git", "dist", "__pycache__"}
 
+# Below this many files process-pool startup costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+
+def _walk_markdown(directory: str, files: List[Path]) -> None:
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in entries:
+        # DirEntry type info comes from the directory read itself (no extra stat)
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in SKIP_DIR_NAMES:
+                _walk_markdown(entry.path, files)
+        elif entry.name.endswith(".md") and entry.is_file():
+            files.append(Path(entry.path))
+
 
 def iter_markdown_files(root: Path) -> List[Path]:
     files: List[Path] = []
-    # Manual walk to allow directory exclusion efficiently
-    for path in root.rglob("*.md"):
-        if not path.is_file():
-            continue
-        parts = set(path.parts)
-        if parts & SKIP_DIR_NAMES:
-            continue
-        files.append(path)
+    # scandir walk pruning excluded directories before descending into them
+    _walk_markdown(str(root), files)
     return files
 
 
 def lint_file(path: Path) -> List[str]:
     lines = path.read_text(encoding="utf-8").splitlines()
+    blank = [not line.strip() for line in lines]
+    n_lines = len(lines)
+    classify = LINE_RE.match
     issues: List[str] = []
 
     # Track ordered list blocks
     in_ol = False
     expected_num = None
-    # Tracking variables (some removed to satisfy linter if unused)
     in_fence = False
 
-    def is_list_line(idx: int) -> bool:
-        line = lines[idx]
-        return bool(OL_ITEM_RE.match(line) or UL_ITEM_RE.match(line))
-
     for i, raw in enumerate(lines):
         line_no = i + 1
         stripped = raw.rstrip()
+        m = classify(stripped)
 
         # Fence detection MD031
-        if FENCE_RE.match(stripped):
+        if m is not None and m.group("fence"):
             if not in_fence:
                 # opening fence requires blank line before unless BOF
-                if i > 0 and lines[i - 1].strip() != "":
+                if i > 0 and not blank[i - 1]:
                     issues.append(
                         f"{path}:{line_no}: MD031 opening fence not preceded by blank line"
                     )
                 in_fence = True
             else:
                 # closing fence requires blank line after unless EOF
-                if i + 1 < len(lines) and lines[i + 1].strip() != "":
+                if i + 1 < n_lines and not blank[i + 1]:
                     issues.append(
                         f"{path}:{line_no}: MD031 closing fence not followed by blank line"
                     )
@@ -76,14 +88,14 @@ def lint_file(path: Path) -> List[str]:
         if in_fence:
             continue  # ignore list / other rules inside code blocks
 
-        m_ol = OL_ITEM_RE.match(stripped)
-        if m_ol:
-            num = int(m_ol.group(2))
+        num_str = m.group("num") if m is not None else None
+        if num_str is not None:
+            num = int(num_str)
             if not in_ol:
                 in_ol = True
                 expected_num = num
                 # MD032: blank before list (unless BOF)
-                if i > 0 and lines[i - 1].strip() != "":
+                if i > 0 and not blank[i - 1]:
                     issues.append(f"{path}:{line_no}: MD032 list not preceded by blank line")
             else:
                 if expected_num is not None:
@@ -96,28 +108,22 @@ def lint_file(path: Path) -> List[str]:
                             )
             continue
 
-        # If we reach here and were in an ordered list, we may be exiting it
-        if in_ol and stripped == "":
+        if not in_ol:
+            continue
+        if stripped == "":
             # Blank line terminates ordered list cleanly
             in_ol = False
             expected_num = None
-            # reset state after blank line
-            continue
-        elif in_ol and stripped != "" and not is_list_line(i):
-            # list terminated without blank line after
+        elif m is None and not (raw != stripped and classify(raw) is not None):
+            # list terminated without blank line after (list markers count even with
+            # trailing-whitespace-only content, hence the raw-line recheck)
             issues.append(f"{path}:{line_no}: MD032 list not followed by blank line")
             in_ol = False
             expected_num = None
-            # reset state after non-list content without blank line
-        elif in_ol and stripped == "":
-            # blank line resets state
-            in_ol = False
-            expected_num = None
-            # state cleared
 
     # finalize if file ends during list without trailing blank line (acceptable by many linters, but enforce)
     if in_ol:
-        issues.append(f"{path}:{len(lines)}: MD032 list not followed by blank line at EOF")
+        issues.append(f"{path}:{n_lines}: MD032 list not followed by blank line at EOF")
 
     return issues
 
@@ -126,8 +132,13 @@ def main() -> int:
     root = Path(__file__).resolve().parents[2]  # project root (two levels up from scripts/)
     md_files = iter_markdown_files(root)
     all_issues: List[str] = []
-    for f in md_files:
-        all_issues.extend(lint_file(f))
+    if len(md_files) < PARALLEL_MIN_FILES:
+        for f in md_files:
+            all_issues.extend(lint_file(f))
+    else:
+        with ProcessPoolExecutor() as ex:
+            for issues in ex.map(lint_file, md_files, chunksize=8):
+                all_issues.extend(issues)
 
     if all_issues:
         print("Markdown lint issues found:")
@@ -5,11 +5,20 @@ No Blender API calls here so it can be unit tested headlessly.
 
 from __future__ import annotations
 
+import glob
+import json
 import os
 import sqlite3
+import sys
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 __all__ = [
     "System",
@@ -28,47 +37,192 @@ class Jump:
     to_system_id: int
 
 
-@dataclass(slots=True)
-class Moon:
+class Moon(NamedTuple):
+    """Leaf entity; a NamedTuple keeps construction in C for the (large) moon table."""
+
     id: int
     planet_id: int
     name: str
-    orbit_index: Optional[int] | None
+    orbit_index: Optional[int]
 
 
-@dataclass(slots=True)
+# eq=False: entities are compared by identity (structural __eq__ over nested lists is never used)
+@dataclass(slots=True, eq=False)
 class Planet:
     id: int
     system_id: int
     name: str
-    orbit_index: Optional[int] | None
-    planet_type: Optional[str] | None
+    orbit_index: Optional[int]
+    planet_type: Optional[str]
     moons: List[Moon] = field(default_factory=list)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False)
 class System:
     id: int
     name: str
     x: float
     y: float
     z: float
-    security: Optional[float] | None
+    security: Optional[float]
     region_name: Optional[str] = None
     constellation_name: Optional[str] = None
     npc_station_count: int = 0  # Count of NPC stations in this system
+    planet_count: int = 0  # len(planets), filled by the loader
+    moon_count: int = 0  # total moons across planets, filled by the loader
     planets: List[Planet] = field(default_factory=list)
 
 
-# Simple in-process cache keyed by file identity + limit parameter
-_cache: Dict[Tuple[str, int, int, Optional[int]], List[System]] = {}
+# Bounded in-process LRU cache keyed by file identity + limit parameter
+CACHE_MAX_ENTRIES = 4
+_cache: OrderedDict[Tuple[str, int, int, Optional[int]], List[System]] = OrderedDict()
+
+FETCH_BATCH_SIZE = 10_000  # rows pulled per fetchmany() call while streaming results
+
+
+# db_path as given -> resolved real path (resolved once per process; cleared by clear_cache)
+_realpath_cache: Dict[str, str] = {}
+
+
+def _file_identity(db_path: str | os.PathLike) -> Tuple[str, int, int]:
+    key = os.fspath(db_path)
+    real = _realpath_cache.get(key)
+    if real is None:
+        real = _realpath_cache[key] = os.path.realpath(key)
+    st = os.stat(real)
+    return (real, st.st_size, st.st_mtime_ns)
+
+
+def _cache_get(key: Tuple[str, int, int, Optional[int]]) -> Optional[List[System]]:
+    systems = _cache.get(key)
+    if systems is not None:
+        _cache.move_to_end(key)
+    return systems
+
+
+def _cache_put(key: Tuple[str, int, int, Optional[int]], systems: List[System]) -> None:
+    """Store ``systems`` and evict least recently used entries beyond ``CACHE_MAX_ENTRIES``."""
+    _cache[key] = systems
+    _cache.move_to_end(key)
+    while len(_cache) > CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+_DISK_CACHE_VERSION = 3  # bump when the snapshot row layout changes
+
+
+def _disk_cache_path(path: Path, fid: Tuple[str, int, int], limit_systems: Optional[int]) -> Path:
+    """Return the side-by-side snapshot path for ``path`` keyed by size, mtime and limit."""
+    limit = "all" if limit_systems is None else int(limit_systems)
+    return path.with_name(
+        f"{path.name}.cache-v{_DISK_CACHE_VERSION}-{fid[1]}-{fid[2]}-{limit}.json"
+    )
+
+
+def _disk_cache_key(db_name: str, cache_name: str) -> Optional[Tuple[int, int, int]]:
+    """Parse ``(version, size, mtime_ns)`` from a snapshot file name, or None if malformed."""
+    stem, _, _ext = cache_name[len(db_name) + len(".cache-") :].rpartition(".")
+    parts = stem.split("-")
+    if len(parts) != 4 or not parts[0].startswith("v"):
+        return None
+    try:
+        return int(parts[0][1:]), int(parts[1]), int(parts[2])
+    except ValueError:
+        return None
+
+
+def _systems_to_rows(systems: List[System]) -> list:
+    """Flatten ``systems`` into plain JSON lists (field order of each dataclass)."""
+    return [
+        [
+            s.id,
+            s.name,
+            s.x,
+            s.y,
+            s.z,
+            s.security,
+            s.region_name,
+            s.constellation_name,
+            s.npc_station_count,
+            s.planet_count,
+            s.moon_count,
+            [[p.id, p.system_id, p.name, p.orbit_index, p.planet_type, p.moons] for p in s.planets],
+        ]
+        for s in systems
+    ]
+
+
+def _systems_from_rows(rows: list) -> List[System]:
+    """Rebuild System/Planet/Moon objects from :func:`_systems_to_rows` output."""
+    intern = sys.intern
+    systems: List[System] = []
+    for *fields, planet_rows in rows:
+        planets = [
+            Planet(
+                pid,
+                sid,
+                pname,
+                orbit,
+                intern(ptype) if ptype is not None else None,
+                [Moon(*m) for m in moons],
+            )
+            for pid, sid, pname, orbit, ptype, moons in planet_rows
+        ]
+        systems.append(System(*fields, planets=planets))
+    return systems
+
+
+def _read_disk_cache(cache_path: Path) -> Optional[List[System]]:
+    """Load a JSON systems snapshot, returning None if missing or unreadable.
 
-MAX_SQL_VARS = 900  # safety margin below default SQLite limit (999) for IN clause batching
+    The snapshot is plain data (no pickle), so a planted file cannot run code.
+    """
+    try:
+        with cache_path.open("r", encoding="utf-8") as fh:
+            return _systems_from_rows(json.load(fh))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as e:
+        print(f"[EVEVisualizer][loader] ignoring unreadable disk cache {cache_path.name}: {e}")
+        return None
 
 
-def _file_identity(path: Path) -> Tuple[str, int, int]:
-    st = path.stat()
-    return (str(path.resolve()), int(st.st_size), int(st.st_mtime_ns))
+def _write_disk_cache(path: Path, cache_path: Path, systems: List[System]) -> None:
+    """Persist ``systems`` to ``cache_path`` and drop snapshots of older database versions."""
+    current = _disk_cache_key(path.name, cache_path.name)
+    for stale in cache_path.parent.glob(f"{glob.escape(path.name)}.cache-*"):
+        # Older pickle snapshots (v2 and earlier) are always removed
+        if stale.suffix == ".pkl" or (
+            stale.suffix == ".json" and _disk_cache_key(path.name, stale.name) != current
+        ):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+    # Unique temp name per writer (concurrent Blender sessions), renamed into place atomically
+    tmp_path: Optional[str] = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=cache_path.parent,
+            prefix=f"{cache_path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as fh:
+            tmp_path = fh.name
+            json.dump(_systems_to_rows(systems), fh, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+    except OSError as e:
+        # Read-only directory, disk full or similar - the in-memory result is still valid
+        print(f"[EVEVisualizer][loader] disk cache write skipped: {e}")
+    finally:
+        if tmp_path is not None:  # partial snapshot that was never moved into place
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
 
 _TABLE_SYNONYMS: Dict[str, Tuple[str, ...]] = {
@@ -87,6 +241,11 @@ _TABLE_SYNONYMS: Dict[str, Tuple[str, ...]] = {
     "jumps": ("jumps", "Jumps"),
     "npcstations": ("npcstations", "NpcStations", "npc_stations"),
 }
+# Lowercased once at import; order preserved so the first matching variant still wins
+_TABLE_SYNONYMS_LC: Dict[str, Tuple[str, ...]] = {
+    logical: tuple(dict.fromkeys(v.lower() for v in variants))
+    for logical, variants in _TABLE_SYNONYMS.items()
+}
 
 
 def _resolve_table_names(cur: sqlite3.Cursor) -> Dict[str, str]:
@@ -100,8 +259,7 @@ def _resolve_table_names(cur: sqlite3.Cursor) -> Dict[str, str]:
     resolved: Dict[str, str] = {}
     for logical, variants in _TABLE_SYNONYMS.items():
         found = None
-        for v in variants:
-            key = v.lower()
+        for key in _TABLE_SYNONYMS_LC[logical]:
             if key in existing_lower:
                 found = existing_lower[key]
                 break
@@ -133,22 +291,177 @@ _COL_MOON_NAME = ("name", "moonname")
 _COL_MOON_ORBIT = ("orbit_index", "orbitindex")
 
 
+# Connection tuning for read-only bulk scans. TEMP selection tables used by limited loads
+# still work on a mode=ro connection (the temp schema is separate from the main file). Sizes can be overridden via environment
+# variables (e.g. to shrink memory use on small machines).
+ENV_SQLITE_MMAP_BYTES = "EVE_SQLITE_MMAP_BYTES"
+ENV_SQLITE_CACHE_KIB = "EVE_SQLITE_CACHE_KIB"
+DEFAULT_SQLITE_MMAP_BYTES = 268_435_456  # 256 MiB: read pages via mmap() instead of read()
+DEFAULT_SQLITE_CACHE_KIB = 65_536  # 64 MiB page cache so consecutive table scans don't evict
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        print(f"[EVEVisualizer][loader] ignoring invalid {name}={raw!r}")
+        return default
+
+
+def _read_pragmas() -> Tuple[str, ...]:
+    mmap_bytes = _env_int(ENV_SQLITE_MMAP_BYTES, DEFAULT_SQLITE_MMAP_BYTES)
+    cache_kib = _env_int(ENV_SQLITE_CACHE_KIB, DEFAULT_SQLITE_CACHE_KIB)
+    return (
+        f"PRAGMA mmap_size={mmap_bytes}",
+        f"PRAGMA cache_size=-{cache_kib}",  # negative value = size in KiB rather than pages
+        "PRAGMA temp_store=MEMORY",  # TEMP selection tables never touch disk
+    )
+
+
+def _tune_read_connection(con: sqlite3.Connection) -> None:
+    for pragma in _read_pragmas():
+        con.execute(pragma)
+
+
+# realpath -> (file identity, open connection, opened immutable); reused while the file and
+# its journal state are unchanged so later loads keep SQLite's page and statement caches warm
+# (closed by clear_cache)
+_conn_cache: OrderedDict[str, Tuple[Tuple[str, int, int], sqlite3.Connection, bool]] = OrderedDict()
+
+
+def _has_sidecar_journal(real_path: str) -> bool:
+    """True if a ``-wal`` or ``-journal`` file sits next to the database (writer active)."""
+    return os.path.exists(f"{real_path}-wal") or os.path.exists(f"{real_path}-journal")
+
+
+def _read_connection(fid: Tuple[str, int, int]) -> sqlite3.Connection:
+    # immutable=1 makes SQLite skip locking and ignore -wal/-journal files, so it is only
+    # safe while no writer has left one; otherwise fall back to plain read-only mode.
+    immutable = not _has_sidecar_journal(fid[0])
+    entry = _conn_cache.pop(fid[0], None)
+    if entry is not None:
+        if entry[0] == fid and entry[2] == immutable:
+            _conn_cache[fid[0]] = entry
+            return entry[1]
+        entry[1].close()  # file or journal state changed on disk: drop stale pages and schema
+    mode = "mode=ro&immutable=1" if immutable else "mode=ro"
+    con = sqlite3.connect(f"{Path(fid[0]).as_uri()}?{mode}", uri=True, isolation_level=None)
+    _tune_read_connection(con)
+    _conn_cache[fid[0]] = (fid, con, immutable)
+    while len(_conn_cache) > CACHE_MAX_ENTRIES:
+        _conn_cache.popitem(last=False)[1][1].close()
+    return con
+
+
+@contextmanager
+def _read_transaction(con: sqlite3.Connection):
+    """Yield a cursor inside one explicit transaction.
+
+    The connection is in autocommit mode (``isolation_level=None``), so pysqlite never
+    issues implicit BEGINs; all reads and TEMP inserts of one load share this transaction.
+    """
+    cur = con.cursor()
+    cur.execute("BEGIN")
+    try:
+        yield cur
+    except BaseException:
+        con.rollback()
+        raise
+    con.commit()
+
+
+def _close_connections() -> None:
+    while _conn_cache:
+        _conn_cache.popitem()[1][1].close()
+
+
+def _iter_rows(cur: sqlite3.Cursor):
+    """Yield result rows in ``cur.arraysize`` batches rather than materializing ``fetchall()``."""
+    while rows := cur.fetchmany():
+        yield from rows
+
+
+def _create_id_table(cur: sqlite3.Cursor, name: str, ids) -> None:
+    """(Re)create a TEMP table ``name`` holding ``ids`` for joining against large selections.
+
+    Avoids building huge ``IN (?,?,...)`` parameter lists and the SQLite variable limit.
+    """
+    cur.execute(f"DROP TABLE IF EXISTS temp.{name}")
+    cur.execute(f"CREATE TEMP TABLE {name} (id INTEGER PRIMARY KEY)")
+    cur.executemany(f"INSERT OR IGNORE INTO temp.{name} (id) VALUES (?)", ((i,) for i in ids))
+
+
 def _column_lookup(columns: List[str]):
     """Return a helper that maps candidate synonym tuples to the concrete column name or None."""
+    return _column_lookup_for(tuple(columns))
+
+
+@lru_cache(maxsize=16)
+def _column_lookup_for(columns: Tuple[str, ...]):
+    # One resolver per distinct column layout; answers are memoised per candidate tuple
     lower_map = {c.lower(): c for c in columns}
+    resolved: Dict[Tuple[str, ...], Optional[str]] = {}
 
     def resolve(candidates: Tuple[str, ...]):  # type: ignore[override]
-        for cand in candidates:
-            real = lower_map.get(cand.lower())
-            if real:
-                return real
-        return None
+        if candidates not in resolved:
+            resolved[candidates] = next(
+                (lower_map[c.lower()] for c in candidates if c.lower() in lower_map), None
+            )
+        return resolved[candidates]
 
     return resolve
 
 
+# Introspected schema per file identity, so repeated loads of an unchanged file skip
+# sqlite_master / PRAGMA table_info round trips (cleared by clear_cache)
+@dataclass(slots=True)
+class _SchemaInfo:
+    tables: Dict[str, str]
+    columns: Dict[str, List[str]] = field(default_factory=dict)
+    lookup_tables: Dict[str, Optional[str]] = field(default_factory=dict)
+
+
+_schema_cache: OrderedDict[Tuple[str, int, int], _SchemaInfo] = OrderedDict()
+
+
+def _schema_for(cur: sqlite3.Cursor, fid: Tuple[str, int, int]) -> _SchemaInfo:
+    schema = _schema_cache.get(fid)
+    if schema is None:
+        # Resolution errors propagate and are not memoised
+        schema = _schema_cache[fid] = _SchemaInfo(_resolve_table_names(cur))
+        while len(_schema_cache) > CACHE_MAX_ENTRIES:
+            _schema_cache.popitem(last=False)
+    return schema
+
+
+def _table_columns(cur: sqlite3.Cursor, schema: _SchemaInfo, table: str) -> List[str]:
+    cols = schema.columns.get(table)
+    if cols is None:
+        cur.execute(f"PRAGMA table_info('{table}')")
+        cols = schema.columns[table] = [row[1] for row in cur.fetchall()]
+    return cols
+
+
+def _lookup_table(cur: sqlite3.Cursor, schema: _SchemaInfo, lower_name: str) -> Optional[str]:
+    """Return the actual name of optional table ``lower_name`` (case-insensitive) or None."""
+    if lower_name not in schema.lookup_tables:
+        cur.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND LOWER(name)=?", (lower_name,)
+        )
+        row = cur.fetchone()
+        schema.lookup_tables[lower_name] = row[0] if row else None
+    return schema.lookup_tables[lower_name]
+
+
 def load_data(
-    db_path: str | os.PathLike, *, limit_systems: int | None = None, enable_cache: bool = True
+    db_path: str | os.PathLike,
+    *,
+    limit_systems: int | None = None,
+    enable_cache: bool = True,
+    disk_cache: bool = False,
 ) -> List[System]:
     """Load systems, planets, moons from the SQLite database.
 
@@ -160,26 +473,39 @@ def load_data(
         If provided, truncates the number of systems returned (useful for dev/testing).
     enable_cache: bool
         Return cached result if file unchanged and parameters match.
+    disk_cache: bool
+        Also persist results as a JSON snapshot next to the database (``<db>.cache-*.json``)
+        so later sessions can skip SQL while the file size and mtime are unchanged.
     """
+    try:
+        fid = _file_identity(db_path)
+    except FileNotFoundError:  # pragma: no cover - defensive
+        raise FileNotFoundError(f"Database not found: {db_path}") from None
+    cache_key = (*fid, limit_systems)
+    if enable_cache:
+        hit = _cache_get(cache_key)
+        if hit is not None:
+            return hit
+
     path = Path(db_path)
-    if not path.exists():  # pragma: no cover - defensive
-        raise FileNotFoundError(f"Database not found: {db_path}")
 
-    fid = _file_identity(path)
-    cache_key = (*fid, limit_systems)
-    if enable_cache and cache_key in _cache:
-        return _cache[cache_key]
+    cache_file = _disk_cache_path(path, fid, limit_systems) if disk_cache else None
+    if cache_file is not None:
+        cached = _read_disk_cache(cache_file)
+        if cached is not None:
+            if enable_cache:
+                _cache_put(cache_key, cached)
+            return cached
 
-    with sqlite3.connect(path) as con:
-        con.row_factory = sqlite3.Row
-        cur = con.cursor()
+    with _read_transaction(_read_connection(fid)) as cur:
+        cur.arraysize = FETCH_BATCH_SIZE
 
         # Resolve table names and discover column mappings
-        tables = _resolve_table_names(cur)
+        schema = _schema_for(cur, fid)
+        tables = schema.tables
 
         # Introspect system columns
-        cur.execute(f"PRAGMA table_info('{tables['systems']}')")
-        sys_cols = [row[1] for row in cur.fetchall()]
+        sys_cols = _table_columns(cur, schema, tables["systems"])
         sys_col_resolve = _column_lookup(sys_cols)
         c_id = sys_col_resolve(_COL_SYSTEM_ID)
         c_name = sys_col_resolve(_COL_SYSTEM_NAME)
@@ -202,27 +528,17 @@ def load_data(
                 f"Missing required columns on '{tables['systems']}': {', '.join(missing_core)} (have: {', '.join(sys_cols)})"
             )
 
-        # Build query with JOINs if foreign keys exist
-        sys_select_cols = [f"s.{c}" for c in [c_id, c_name, c_x, c_y, c_z, c_sec] if c]
-
-        # Add region and constellation names if we have the FK columns
-        if c_region_id:
-            sys_select_cols.append("r.name AS region_name")
-        if c_const_id:
-            sys_select_cols.append("c.name AS constellation_name")
-
-        sys_query = f"SELECT {', '.join(sys_select_cols)} FROM {tables['systems']} s"
-
         # LEFT JOIN with Regions and Constellations if foreign keys present
+        joins = ""
+        region_expr = "NULL"
+        const_expr = "NULL"
         if c_region_id:
             # Try to find Regions table
             try:
-                cur.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND LOWER(name)='regions'"
-                )
-                regions_table = cur.fetchone()
+                regions_table = _lookup_table(cur, schema, "regions")
                 if regions_table:
-                    sys_query += f" LEFT JOIN {regions_table[0]} r ON s.{c_region_id} = r.regionId"
+                    joins += f" LEFT JOIN {regions_table} r ON s.{c_region_id} = r.regionId"
+                    region_expr = "r.name"
             except sqlite3.DatabaseError:
                 # Unexpected DB error during metadata lookup - skip joining
                 pass
@@ -230,69 +546,64 @@ def load_data(
         if c_const_id:
             # Try to find Constellations table
             try:
-                cur.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND LOWER(name)='constellations'"
-                )
-                constellations_table = cur.fetchone()
+                constellations_table = _lookup_table(cur, schema, "constellations")
                 if constellations_table:
-                    sys_query += f" LEFT JOIN {constellations_table[0]} c ON s.{c_const_id} = c.constellationId"
+                    joins += (
+                        f" LEFT JOIN {constellations_table} c ON s.{c_const_id} = c.constellationId"
+                    )
+                    const_expr = "c.name"
             except sqlite3.DatabaseError:
                 # Unexpected DB error during metadata lookup - skip joining
                 pass
 
+        # Fixed column layout (NULL for absent optional columns) so rows unpack positionally
+        sys_select_cols = [
+            f"s.{c_id}",
+            f"s.{c_name}",
+            f"s.{c_x}",
+            f"s.{c_y}",
+            f"s.{c_z}",
+            f"s.{c_sec}" if c_sec else "NULL",
+            region_expr,
+            const_expr,
+        ]
+        sys_query = f"SELECT {', '.join(sys_select_cols)} FROM {tables['systems']} s{joins}"
         sys_query += f" ORDER BY s.{c_id}"
         if limit_systems is not None:
             sys_query += f" LIMIT {int(limit_systems)}"
         cur.execute(sys_query)
-        system_rows = cur.fetchall()
 
-        # Build case-insensitive mapping for rows
         system_map: Dict[int, System] = {}
-        for r in system_rows:
-            # sqlite3.Row supports key lookup by original names and aliases
-            rid = int(r[c_id] if c_id in r.keys() else r[0])
+        for rid, name, x, y, z, sec, region_name, constellation_name in _iter_rows(cur):
+            rid = int(rid)
             security_val = None
-            if c_sec and c_sec in r.keys() and r[c_sec] is not None:
+            if sec is not None:
                 try:
-                    security_val = float(r[c_sec])
+                    security_val = float(sec)
                 except (ValueError, TypeError):
                     security_val = None
 
-            # Extract region and constellation names if available
-            region_name = None
-            constellation_name = None
-            try:
-                if "region_name" in r.keys() and r["region_name"]:
-                    region_name = str(r["region_name"])
-            except (TypeError, ValueError):
-                pass
-            try:
-                if "constellation_name" in r.keys() and r["constellation_name"]:
-                    constellation_name = str(r["constellation_name"])
-            except (TypeError, ValueError):
-                pass
-
             system_map[rid] = System(
-                id=rid,
-                name=str(r[c_name] if c_name in r.keys() else r[1]),
-                x=float(r[c_x] if c_x in r.keys() else r[2]),
-                y=float(r[c_y] if c_y in r.keys() else r[3]),
-                z=float(r[c_z] if c_z in r.keys() else r[4]),
-                security=security_val,
-                region_name=region_name,
-                constellation_name=constellation_name,
+                rid,
+                str(name),
+                float(x),
+                float(y),
+                float(z),
+                security_val,
+                str(region_name) if region_name else None,
+                str(constellation_name) if constellation_name else None,
             )
 
         if not system_map:
             systems: List[System] = []
+            if cache_file is not None:
+                _write_disk_cache(path, cache_file, systems)
             if enable_cache:
-                _cache[cache_key] = systems
+                _cache_put(cache_key, systems)
             return systems
 
-        # Planets filtered by selected systems (if limited)
-        sys_ids = tuple(system_map.keys())
-        cur.execute(f"PRAGMA table_info('{tables['planets']}')")
-        pl_cols = [row[1] for row in cur.fetchall()]
+        # Planets: full scan when unlimited, otherwise filtered by the selected systems
+        pl_cols = _table_columns(cur, schema, tables["planets"])
         pl_resolve = _column_lookup(pl_cols)
         pl_id = pl_resolve(_COL_PLANET_ID)
         pl_sys = pl_resolve(_COL_PLANET_SYSTEM_ID)
@@ -306,43 +617,43 @@ def load_data(
             raise RuntimeError(
                 f"Missing required columns on '{tables['planets']}': {', '.join(missing_pl)} (have: {', '.join(pl_cols)})"
             )
-        pl_select = [c for c in (pl_id, pl_sys, pl_name, pl_orbit, pl_type) if c]
-        planet_rows = []
-        if sys_ids:
-            # Batch to avoid "too many SQL variables" for large datasets
-            for i in range(0, len(sys_ids), MAX_SQL_VARS):
-                chunk = sys_ids[i : i + MAX_SQL_VARS]
-                placeholder = ",".join(["?"] * len(chunk))
-                cur.execute(
-                    f"SELECT {', '.join(pl_select)} FROM {tables['planets']} WHERE {pl_sys} IN ({placeholder})",
-                    chunk,
-                )
-                planet_rows.extend(cur.fetchall())
-        # Sort to keep deterministic ordering by planet id
-        try:
-            planet_rows.sort(key=lambda r: int(r[pl_id]))  # type: ignore[arg-type]
-        except (ValueError, TypeError):
-            pass
-        planet_map: Dict[int, Planet] = {}
-        for r in planet_rows:
-            rid = int(r[pl_id])
-            p = Planet(
-                id=rid,
-                system_id=int(r[pl_sys]),
-                name=str(r[pl_name]),
-                orbit_index=(r[pl_orbit] if (pl_orbit and r[pl_orbit] is not None) else None),
-                planet_type=(str(r[pl_type]) if (pl_type and r[pl_type] is not None) else None),
+        pl_select = [
+            f"p.{pl_id}",
+            f"p.{pl_sys}",
+            f"p.{pl_name}",
+            f"p.{pl_orbit}" if pl_orbit else "NULL",
+            f"p.{pl_type}" if pl_type else "NULL",
+        ]
+        pl_query = f"SELECT {', '.join(pl_select)} FROM {tables['planets']} p"
+        if limit_systems is not None:
+            # Limited selection: join against a temp table of the chosen system ids
+            _create_id_table(cur, "_eve_sel_systems", system_map.keys())
+            pl_query += f" JOIN temp._eve_sel_systems sel ON p.{pl_sys} = sel.id"
+        # Presorted by parent so linking below is one lookup per system, not per planet
+        pl_query += f" ORDER BY p.{pl_sys}, p.{pl_id}"
+        cur.execute(pl_query)
+        # planet_type has only a handful of distinct values: intern so rows share one str each
+        intern = sys.intern
+        planets = [
+            Planet(
+                int(pid),
+                int(sid),
+                str(name),
+                orbit,
+                intern(str(ptype)) if ptype is not None else None,
             )
-            planet_map[p.id] = p
-            parent = system_map.get(p.system_id)
+            for pid, sid, name, orbit, ptype in _iter_rows(cur)
+        ]
+        planet_map: Dict[int, Planet] = {p.id: p for p in planets}
+        for sid, group in groupby(planets, key=attrgetter("system_id")):
+            parent = system_map.get(sid)
             if parent:
-                parent.planets.append(p)
+                parent.planets.extend(group)
+                parent.planet_count = len(parent.planets)
 
         # Moons filtered by selected planets
         if planet_map:
-            planet_ids = tuple(planet_map.keys())
-            cur.execute(f"PRAGMA table_info('{tables['moons']}')")
-            moon_cols = [row[1] for row in cur.fetchall()]
+            moon_cols = _table_columns(cur, schema, tables["moons"])
             moon_resolve = _column_lookup(moon_cols)
             m_id = moon_resolve(_COL_MOON_ID)
             m_planet_id = moon_resolve(_COL_MOON_PLANET_ID)
@@ -357,39 +668,41 @@ def load_data(
                 raise RuntimeError(
                     f"Missing required columns on '{tables['moons']}': {', '.join(missing_m)} (have: {', '.join(moon_cols)})"
                 )
-            moon_select = [c for c in (m_id, m_planet_id, m_name, m_orbit) if c]
-            moon_rows = []
-            if planet_ids:
-                for i in range(0, len(planet_ids), MAX_SQL_VARS):
-                    chunk = planet_ids[i : i + MAX_SQL_VARS]
-                    placeholder = ",".join(["?"] * len(chunk))
-                    cur.execute(
-                        f"SELECT {', '.join(moon_select)} FROM {tables['moons']} WHERE {m_planet_id} IN ({placeholder})",
-                        chunk,
-                    )
-                    moon_rows.extend(cur.fetchall())
-            try:
-                moon_rows.sort(key=lambda r: int(r[m_id]))  # type: ignore[arg-type]
-            except (ValueError, TypeError):
-                pass
-            for r in moon_rows:
-                mid = int(r[m_id])
-                m = Moon(
-                    id=mid,
-                    planet_id=int(r[m_planet_id]),
-                    name=str(r[m_name]),
-                    orbit_index=(r[m_orbit] if (m_orbit and r[m_orbit] is not None) else None),
+            moon_select = [
+                f"m.{m_id}",
+                f"m.{m_planet_id}",
+                f"m.{m_name}",
+                f"m.{m_orbit}" if m_orbit else "NULL",
+            ]
+            moon_query = f"SELECT {', '.join(moon_select)} FROM {tables['moons']} m"
+            if limit_systems is not None:
+                # Reuse the selected-systems temp table via the planets table
+                moon_query += (
+                    f" JOIN {tables['planets']} p ON m.{m_planet_id} = p.{pl_id}"
+                    f" JOIN temp._eve_sel_systems sel ON p.{pl_sys} = sel.id"
                 )
-                parent = planet_map.get(m.planet_id)
+            moon_query += f" ORDER BY m.{m_planet_id}, m.{m_id}"
+            cur.execute(moon_query)
+            moons = [
+                Moon(int(mid), int(pid), str(name), orbit)
+                for mid, pid, name, orbit in _iter_rows(cur)
+            ]
+            for pid, group in groupby(moons, key=attrgetter("planet_id")):
+                parent = planet_map.get(pid)
                 if parent:
-                    parent.moons.append(m)
+                    # A planet can span several runs (mixed INTEGER/TEXT ids sort apart in SQL
+                    # but int() merges them), so count only this run's moons
+                    group = list(group)
+                    parent.moons.extend(group)
+                    owner = system_map.get(parent.system_id)
+                    if owner:
+                        owner.moon_count += len(group)
 
         # Load NPC station counts per system (optional table)
         if "npcstations" in tables:
             try:
                 # Find the system_id column (could be solarSystemId, system_id, etc.)
-                cur.execute(f"PRAGMA table_info('{tables['npcstations']}')")
-                station_cols = [row[1] for row in cur.fetchall()]
+                station_cols = _table_columns(cur, schema, tables["npcstations"])
                 station_col_resolve = _column_lookup(station_cols)
                 station_sys_id = station_col_resolve(
                     ("solarSystemId", "system_id", "systemId", "SystemId")
@@ -399,12 +712,10 @@ def load_data(
                     cur.execute(
                         f"SELECT {station_sys_id}, COUNT(*) FROM {tables['npcstations']} GROUP BY {station_sys_id}"
                     )
-                    station_counts = cur.fetchall()
-                    for row in station_counts:
-                        sys_id = int(row[0])
-                        count = int(row[1])
+                    for sys_id, count in _iter_rows(cur):
+                        sys_id = int(sys_id)
                         if sys_id in system_map:
-                            system_map[sys_id].npc_station_count = count
+                            system_map[sys_id].npc_station_count = int(count)
             except (sqlite3.DatabaseError, ValueError, TypeError, KeyError):
                 # Table might not exist or have different schema - skip silently
                 pass
@@ -417,19 +728,26 @@ def load_data(
             "[EVEVisualizer][debug] Loaded systems count=",
             len(systems),
             " planets=",
-            sum(len(s.planets) for s in systems),
+            sum(s.planet_count for s in systems),
             " moons=",
-            sum(len(p.moons) for s in systems for p in s.planets),
+            sum(s.moon_count for s in systems),
             " npc_stations=",
             total_stations,
         )
+    if cache_file is not None:
+        _write_disk_cache(path, cache_file, systems)
     if enable_cache:
-        _cache[cache_key] = systems
+        _cache_put(cache_key, systems)
     return systems
 
 
-def clear_cache():  # pragma: no cover - utility
+def clear_cache():
+    """Drop all in-memory caches and close cached read connections."""
     _cache.clear()
+    _realpath_cache.clear()
+    _schema_cache.clear()
+    _close_connections()
+    _column_lookup_for.cache_clear()
 
 
 def load_jumps(db_path: str | os.PathLike, system_ids: Optional[List[int]] = None) -> List[Jump]:
@@ -447,26 +765,26 @@ def load_jumps(db_path: str | os.PathLike, system_ids: Optional[List[int]] = Non
     List[Jump]
         List of Jump objects connecting solar systems.
     """
-    path = Path(db_path)
-    if not path.exists():  # pragma: no cover - defensive
-        raise FileNotFoundError(f"Database not found: {db_path}")
+    try:
+        fid = _file_identity(db_path)
+    except FileNotFoundError:  # pragma: no cover - defensive
+        raise FileNotFoundError(f"Database not found: {db_path}") from None
 
     jumps: List[Jump] = []
 
-    with sqlite3.connect(path) as con:
-        con.row_factory = sqlite3.Row
-        cur = con.cursor()
+    with _read_transaction(_read_connection(fid)) as cur:
+        cur.arraysize = FETCH_BATCH_SIZE
 
         # Resolve table names
-        tables = _resolve_table_names(cur)
+        schema = _schema_for(cur, fid)
+        tables = schema.tables
 
         if "jumps" not in tables:
             # No jumps table - return empty list
             return jumps
 
         # Introspect jumps table
-        cur.execute(f"PRAGMA table_info('{tables['jumps']}')")
-        jump_cols = [row[1] for row in cur.fetchall()]
+        jump_cols = _table_columns(cur, schema, tables["jumps"])
         jump_resolve = _column_lookup(jump_cols)
 
         # Common column name variations
@@ -479,30 +797,16 @@ def load_jumps(db_path: str | os.PathLike, system_ids: Optional[List[int]] = Non
             # Can't find the required columns
             return jumps
 
-        # Build query with batching to avoid "too many SQL variables" error
-        jump_rows = []
+        query = f"SELECT j.{c_from}, j.{c_to} FROM {tables['jumps']} j"
         if system_ids:
-            # Batch to avoid exceeding SQLite's variable limit (999)
-            # Since we use system_ids twice (for from and to), we need to keep total under 999
-            # Safe batch size is 450 (450 * 2 = 900 < 999)
-            batch_size = 450
-            sys_tuple = tuple(system_ids)
-
-            for i in range(0, len(sys_tuple), batch_size):
-                chunk = sys_tuple[i : i + batch_size]
-                placeholder = ",".join(["?"] * len(chunk))
-                query = f"SELECT {c_from}, {c_to} FROM {tables['jumps']} WHERE {c_from} IN ({placeholder}) AND {c_to} IN ({placeholder})"
-                cur.execute(query, chunk + chunk)
-                jump_rows.extend(cur.fetchall())
-        else:
-            # Load all jumps
-            query = f"SELECT {c_from}, {c_to} FROM {tables['jumps']}"
-            cur.execute(query)
-            jump_rows = cur.fetchall()
-
-        for r in jump_rows:
-            from_id = int(r[c_from])
-            to_id = int(r[c_to])
-            jumps.append(Jump(from_system_id=from_id, to_system_id=to_id))
+            # Keep only jumps with both endpoints selected: one statement joining a TEMP id
+            # table (no IN-clause batching, so edges between batches are not lost)
+            _create_id_table(cur, "_eve_jump_systems", system_ids)
+            query += (
+                f" JOIN temp._eve_jump_systems a ON j.{c_from} = a.id"
+                f" JOIN temp._eve_jump_systems b ON j.{c_to} = b.id"
+            )
+        cur.execute(query)
+        jumps.extend(Jump(int(f), int(t)) for f, t in _iter_rows(cur))
 
     return jumps
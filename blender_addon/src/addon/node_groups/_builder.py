@@ -0,0 +1,63 @@
+"""Shared scaffolding for strategy node groups.
+
+Every strategy group exposes the same Color/Strength outputs; this module owns the
+remove-and-recreate boilerplate so each strategy module only builds its own nodes.
+"""
+
+from __future__ import annotations
+
+try:  # pragma: no cover
+    import bpy  # type: ignore
+except (ImportError, ModuleNotFoundError):  # noqa: BLE001
+    bpy = None  # type: ignore
+
+# (name, socket type) of the outputs shared by all strategy groups
+STRATEGY_OUTPUTS = (
+    ("Color", "NodeSocketColor"),
+    ("Strength", "NodeSocketFloat"),
+)
+
+# Custom property recording which revision of a module's node layout built the group.
+# Bump a module's SPEC_VERSION whenever its ensure_node_group() output changes.
+SPEC_VERSION_KEY = "eve_spec_version"
+
+
+def strategy_group_is_current(group_name: str, spec_version: int) -> bool:
+    """Return True if ``group_name`` exists and was built from ``spec_version``.
+
+    Lets ensure_node_group() skip remove-and-rebuild, which would otherwise force every
+    material using the group to recompile its shader.
+    """
+    if not bpy:
+        return False
+    group = bpy.data.node_groups.get(group_name)  # type: ignore[attr-defined]
+    if group is None or len(group.nodes) < 2:  # missing or emptied by the user
+        return False
+    return group.get(SPEC_VERSION_KEY) == spec_version
+
+
+def new_strategy_group(group_name: str, output_location=(600, 0), spec_version: int = 1):
+    """Replace ``group_name`` with an empty shader node group wired for strategy outputs.
+
+    Args:
+        group_name: Node group name (e.g. "EVE_Strategy_UniformOrange")
+        output_location: Editor location of the Group Output node
+        spec_version: Layout revision stored on the group (see strategy_group_is_current)
+
+    Returns:
+        tuple: (node group, Group Output node), or (None, None) outside Blender
+    """
+    if not bpy:
+        return None, None
+
+    existing = bpy.data.node_groups.get(group_name)  # type: ignore[attr-defined]
+    if existing is not None:
+        bpy.data.node_groups.remove(existing)  # type: ignore[attr-defined]
+
+    group = bpy.data.node_groups.new(group_name, "ShaderNodeTree")  # type: ignore[attr-defined]
+    group[SPEC_VERSION_KEY] = spec_version
+    output = group.nodes.new("NodeGroupOutput")
+    output.location = output_location
+    for name, socket_type in STRATEGY_OUTPUTS:
+        group.interface.new_socket(name=name, socket_type=socket_type, in_out="OUTPUT")
+    return group, output
@@ -10,6 +10,8 @@ try:  # pragma: no cover
 except (ImportError, ModuleNotFoundError):  # noqa: BLE001
     bpy = None  # type: ignore
 
+from ._builder import new_strategy_group
+
 
 def ensure_node_group(context=None):
     """Create or update the Character Rainbow node group.
@@ -45,20 +47,12 @@ def ensure_node_group(context=None):
         if attr_char and attr_char.type == "ATTRIBUTE":
             attr_char.attribute_name = f"eve_name_char_index_{char_index}_ord"
             return group_name
-        # If structure is broken, fall through to recreate
-        bpy.data.node_groups.remove(existing_group)  # type: ignore[attr-defined]
+        # If structure is broken, fall through to recreate (new_strategy_group removes it)
 
-    # Create new node group
-    group = bpy.data.node_groups.new(group_name, "ShaderNodeTree")  # type: ignore[attr-defined]
+    group, output = new_strategy_group(group_name, output_location=(600, 0))
     nodes = group.nodes
     links = group.links
 
-    # Create group outputs
-    output = nodes.new("NodeGroupOutput")
-    output.location = (600, 0)
-    group.interface.new_socket(name="Color", socket_type="NodeSocketColor", in_out="OUTPUT")
-    group.interface.new_socket(name="Strength", socket_type="NodeSocketFloat", in_out="OUTPUT")
-
     # === COLOR PATH: Selected character → HSV or Grey ===
 
     # Read selected character index (NAMED so we can find it for updates)
@@ -10,6 +10,20 @@ try:  # pragma: no cover
 except (ImportError, ModuleNotFoundError):  # noqa: BLE001
     bpy = None  # type: ignore
 
+from ._builder import new_strategy_group, strategy_group_is_current
+
+# Bump when the nodes built below change so existing files rebuild the group
+SPEC_VERSION = 1
+
+# (ColorRamp position, RGBA) per pattern category, in ascending position order
+PATTERN_COLOR_STOPS = (
+    (0.0, (0.2, 0.4, 0.8, 1.0)),  # Blue - DASH
+    (0.25, (1.0, 0.5, 0.2, 1.0)),  # Orange - COLON
+    (0.5, (0.6, 0.2, 0.8, 1.0)),  # Purple - DOTSEQ
+    (0.75, (0.2, 0.8, 0.3, 1.0)),  # Green - PIPE
+    (1.0, (0.5, 0.5, 0.5, 1.0)),  # Gray - OTHER
+)
+
 
 def ensure_node_group():
     """Create or update the Pattern Categories node group.
@@ -26,22 +40,15 @@ def ensure_node_group():
         return ""
 
     group_name = "EVE_Strategy_PatternCategories"
+    if strategy_group_is_current(group_name, SPEC_VERSION):
+        return group_name
 
-    # Remove existing if present
-    if group_name in bpy.data.node_groups:  # type: ignore[attr-defined]
-        bpy.data.node_groups.remove(bpy.data.node_groups[group_name])  # type: ignore[attr-defined]
-
-    # Create new node group
-    group = bpy.data.node_groups.new(group_name, "ShaderNodeTree")  # type: ignore[attr-defined]
+    group, output = new_strategy_group(
+        group_name, output_location=(400, 0), spec_version=SPEC_VERSION
+    )
     nodes = group.nodes
     links = group.links
 
-    # Create group outputs
-    output = nodes.new("NodeGroupOutput")
-    output.location = (400, 0)
-    group.interface.new_socket(name="Color", socket_type="NodeSocketColor", in_out="OUTPUT")
-    group.interface.new_socket(name="Strength", socket_type="NodeSocketFloat", in_out="OUTPUT")
-
     # === COLOR PATH: Pattern category → ColorRamp ===
 
     # Read pattern category (0-4: DASH/COLON/DOTSEQ/PIPE/OTHER)
@@ -65,25 +72,16 @@ def ensure_node_group():
     color_ramp.location = (-200, 200)
     color_ramp.color_ramp.interpolation = "CONSTANT"  # Sharp transitions
 
-    # Clear default elements
-    while len(color_ramp.color_ramp.elements) > 2:
-        color_ramp.color_ramp.elements.remove(color_ramp.color_ramp.elements[0])
-
-    # Set up 5 color stops (one per category)
-    color_ramp.color_ramp.elements[0].position = 0.0
-    color_ramp.color_ramp.elements[0].color = (0.2, 0.4, 0.8, 1.0)  # Blue - DASH
-
-    color_ramp.color_ramp.elements[1].position = 1.0
-    color_ramp.color_ramp.elements[1].color = (0.5, 0.5, 0.5, 1.0)  # Gray - OTHER
-
-    elem1 = color_ramp.color_ramp.elements.new(0.25)
-    elem1.color = (1.0, 0.5, 0.2, 1.0)  # Orange - COLON
-
-    elem2 = color_ramp.color_ramp.elements.new(0.5)
-    elem2.color = (0.6, 0.2, 0.8, 1.0)  # Purple - DOTSEQ
-
-    elem3 = color_ramp.color_ramp.elements.new(0.75)
-    elem3.color = (0.2, 0.8, 0.3, 1.0)  # Green - PIPE
+    # A new ColorRamp always has exactly two stops: reuse them for the end positions and
+    # insert the inner stops in ascending order so Blender never re-sorts the element list
+    elements = color_ramp.color_ramp.elements
+    (first_pos, first_color), *inner, (last_pos, last_color) = PATTERN_COLOR_STOPS
+    elements[0].position = first_pos
+    elements[0].color = first_color
+    elements[1].position = last_pos
+    elements[1].color = last_color
+    for position, color in inner:
+        elements.new(position).color = color
 
     links.new(map_range.outputs["Result"], color_ramp.inputs["Fac"])
 
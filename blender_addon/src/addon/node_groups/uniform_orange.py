@@ -10,6 +10,11 @@ try:  # pragma: no cover
 except (ImportError, ModuleNotFoundError):  # noqa: BLE001
     bpy = None  # type: ignore
 
+from ._builder import new_strategy_group, strategy_group_is_current
+
+# Bump when the nodes built below change so existing files rebuild the group
+SPEC_VERSION = 1
+
 
 def ensure_node_group():
     """Create or update the Uniform Orange node group.
@@ -26,22 +31,15 @@ def ensure_node_group():
         return ""
 
     group_name = "EVE_Strategy_UniformOrange"
+    if strategy_group_is_current(group_name, SPEC_VERSION):
+        return group_name
 
-    # Remove existing if present
-    if group_name in bpy.data.node_groups:  # type: ignore[attr-defined]
-        bpy.data.node_groups.remove(bpy.data.node_groups[group_name])  # type: ignore[attr-defined]
-
-    # Create new node group
-    group = bpy.data.node_groups.new(group_name, "ShaderNodeTree")  # type: ignore[attr-defined]
+    group, output = new_strategy_group(
+        group_name, output_location=(200, 0), spec_version=SPEC_VERSION
+    )
     nodes = group.nodes
     links = group.links
 
-    # Create group outputs
-    output = nodes.new("NodeGroupOutput")
-    output.location = (200, 0)
-    group.interface.new_socket(name="Color", socket_type="NodeSocketColor", in_out="OUTPUT")
-    group.interface.new_socket(name="Strength", socket_type="NodeSocketFloat", in_out="OUTPUT")
-
     # === COLOR: Constant orange-red ===
     color_value = nodes.new("ShaderNodeRGB")
     color_value.location = (-200, 100)
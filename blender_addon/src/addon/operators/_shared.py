@@ -52,6 +52,34 @@ def get_or_create_subcollection(parent, name: str):  # pragma: no cover - needs
     return coll
 
 
+def remove_objects(objects) -> int:  # pragma: no cover - needs Blender
+    """Delete ``objects`` in one ``bpy.data.batch_remove`` call; return how many were removed.
+
+    Falls back to per-object removal on Blender versions without batch_remove.
+    """
+    if bpy is None:
+        return 0
+    if not isinstance(objects, set):
+        objects = set(objects)
+    if not objects:
+        return 0
+    try:
+        # batch_remove is significantly faster for large numbers of objects
+        bpy.data.batch_remove(ids=objects)
+        return len(objects)
+    except (AttributeError, TypeError):  # noqa: BLE001
+        # Fallback for older Blender versions or if batch_remove fails
+        removed = 0
+        for obj in objects:
+            try:
+                bpy.data.objects.remove(obj, do_unlink=True)
+                removed += 1
+            except (RuntimeError, AttributeError, TypeError):  # noqa: BLE001
+                # Skip objects that fail removal for Blender API reasons
+                pass
+        return removed
+
+
 def clear_generated():  # pragma: no cover - needs Blender
     if bpy is None:
         return 0, 0
@@ -63,9 +91,10 @@ def clear_generated():  # pragma: no cover - needs Blender
         # First pass: collect all objects and collections to remove
         objects_to_remove = set()
         collections_to_remove = []
+        collections = bpy.data.collections
 
         for cname in GENERATED_COLLECTIONS:
-            coll = bpy.data.collections.get(cname)
+            coll = collections.get(cname)
             if not coll:
                 continue
 
@@ -75,32 +104,18 @@ def clear_generated():  # pragma: no cover - needs Blender
                 current = collections_to_process.pop()
                 collections_to_remove.append(current)
                 # Add child collections to process queue
-                collections_to_process.extend(list(current.children))
+                collections_to_process.extend(current.children)
                 # Collect all objects in current collection
                 objects_to_remove.update(current.objects)
 
         # Second pass: batch remove all objects (much faster than one-by-one)
-        # Use batch_remove if available (Blender 3.2+), otherwise fall back to loop
-        if objects_to_remove:
-            try:
-                # batch_remove is significantly faster for large numbers of objects
-                bpy.data.batch_remove(ids=objects_to_remove)
-                removed_objs = len(objects_to_remove)
-            except (AttributeError, TypeError):  # noqa: BLE001
-                # Fallback for older Blender versions or if batch_remove fails
-                for obj in objects_to_remove:
-                    try:
-                        bpy.data.objects.remove(obj, do_unlink=True)
-                        removed_objs += 1
-                    except (RuntimeError, AttributeError, TypeError):  # noqa: BLE001
-                        # Skip objects that fail removal for Blender API reasons
-                        pass
+        removed_objs = remove_objects(objects_to_remove)
 
         # Third pass: remove collections in reverse order (children before parents)
         # This ensures we don't try to remove a parent before its children
         for coll in reversed(collections_to_remove):
             try:
-                bpy.data.collections.remove(coll)
+                collections.remove(coll)
                 removed_colls += 1
             except (RuntimeError, AttributeError):  # noqa: BLE001
                 # Skip collections that fail removal (linked elsewhere or API issue)
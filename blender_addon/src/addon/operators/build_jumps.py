@@ -8,6 +8,7 @@ except (ImportError, ModuleNotFoundError):  # noqa: BLE001
     bpy = None  # type: ignore
 
 from .. import data_state
+from ._shared import remove_objects
 
 
 class EVE_OT_build_jumps(bpy.types.Operator):  # type: ignore[misc,name-defined]
@@ -65,8 +66,7 @@ class EVE_OT_build_jumps(bpy.types.Operator):  # type: ignore[misc,name-defined]
             frontier.children.link(jumps_coll)
         else:
             # Clear existing jump objects
-            for obj in list(jumps_coll.objects):
-                bpy.data.objects.remove(obj, do_unlink=True)  # type: ignore[attr-defined]
+            remove_objects(jumps_coll.objects)
 
         # Create jump material
         mat_name = "EVE_JumpMaterial"
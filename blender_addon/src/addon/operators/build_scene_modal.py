@@ -6,15 +6,12 @@ Only systems are instantiated (planets/moons counts kept as custom props).
 from __future__ import annotations
 
 import random
-import re
 
 try:  # pragma: no cover  # noqa: I001 (dynamic bpy import grouping)
-    import bmesh  # type: ignore
     import bpy  # type: ignore
 except (ImportError, ModuleNotFoundError):  # pragma: no cover  # noqa: BLE001
     # Running outside Blender (tests/CI)
     bpy = None  # type: ignore
-    bmesh = None  # type: ignore
 
 
 from .. import data_state
@@ -27,9 +24,9 @@ from ._shared import (
 )
 from .property_calculators import (
     calculate_char_indices,
-    calculate_child_metrics,
     calculate_name_char_bucket,
     calculate_name_pattern_category,
+    filter_excluded_systems,
     is_blackhole_system,
     is_proper_noun,
 )
@@ -38,6 +35,14 @@ from .property_calculators import (
 DEFAULT_OTHER_PATTERN_IDX = 4
 DEFAULT_BLACKHOLE_PATTERN_IDX = 5
 
+# Custom property names for the per-character ordinals read by the strategy node groups
+_CHAR_INDEX_KEYS = tuple(f"eve_name_char_index_{i}_ord" for i in range(10))
+
+
+def _sanitize_collection_name(name: str) -> str:
+    """Collection-safe key: alphanumerics, '_' and '-' kept, everything else '_', max 64 chars."""
+    return "".join(c if c.isalnum() or c in ("_", "-") else "_" for c in name)[:64]
+
 
 def _ensure_mesh(kind: str, r: float):  # pragma: no cover
     if not bpy:
@@ -46,15 +51,17 @@ def _ensure_mesh(kind: str, r: float):  # pragma: no cover
     mesh = bpy.data.meshes.get(key)
     if mesh:
         return mesh
+    # Deferred import: bmesh is only needed the first time a template mesh is built
+    import bmesh  # type: ignore
+
     mesh = bpy.data.meshes.new(key)
-    if bmesh:
-        bm = bmesh.new()
-        if kind == "ICO":
-            bmesh.ops.create_icosphere(bm, subdivisions=1, radius=r)
-        else:
-            bmesh.ops.create_uvsphere(bm, u_segments=16, v_segments=8, radius=r)
-        bm.to_mesh(mesh)
-        bm.free()
+    bm = bmesh.new()
+    if kind == "ICO":
+        bmesh.ops.create_icosphere(bm, subdivisions=1, radius=r)
+    else:
+        bmesh.ops.create_uvsphere(bm, u_segments=16, v_segments=8, radius=r)
+    bm.to_mesh(mesh)
+    bm.free()
     return mesh
 
 
@@ -82,7 +89,30 @@ if bpy:
         _scale = 1.0
         _apply_axis = False
         _hierarchy = False
+        _auto_apply = False
         _region_cache = None
+        _locations = None
+
+        def _scaled_locations(self, systems):
+            """Return world-space locations for ``systems`` as a list of (x, y, z) tuples.
+
+            Scale and the optional Rx-90 axis swap are applied in a single array pass
+            instead of per object inside the modal loop.
+            """
+            # Deferred import: numpy (bundled with Blender) is only needed once a build starts,
+            # so enabling the add-on does not pay its import cost.
+            import numpy as np  # type: ignore
+
+            coords = np.fromiter(
+                (c for s in systems for c in (s.x, s.y, s.z)),
+                dtype=np.float64,
+                count=len(systems) * 3,
+            ).reshape(-1, 3)
+            coords *= self._scale
+            if self._apply_axis:  # Rx-90 transformation (X,Y,Z) -> (X,Z,-Y)
+                coords = coords[:, (0, 2, 1)]
+                coords[:, 2] *= -1.0
+            return [tuple(row) for row in coords.tolist()]
 
         def _init(self, context):
             systems = data_state.get_loaded_systems()
@@ -90,26 +120,14 @@ if bpy:
                 self.report({"ERROR"}, "No data loaded")
                 return False
             prefs = get_prefs(context)
+            # Preference values are typed Blender properties (or the defaults below when prefs
+            # are unavailable), so they are read and clamped once here without try/except.
             # --- Optional exclusions (apply before sampling so percentage reflects kept set) ---
-            try:
-                excl_ad = bool(getattr(prefs, "exclude_ad_systems", False))
-                excl_vdash = bool(getattr(prefs, "exclude_vdash_systems", False))
-            except (AttributeError, TypeError):
-                excl_ad = excl_vdash = False
+            excl_ad = bool(getattr(prefs, "exclude_ad_systems", False))
+            excl_vdash = bool(getattr(prefs, "exclude_vdash_systems", False))
             if excl_ad or excl_vdash:
-                filtered = []
-                re_ad = re.compile(r"^AD\d{3}$", re.IGNORECASE)
-                re_vdash = re.compile(r"^V-\d{3}$", re.IGNORECASE)
-                for s in systems:
-                    nm = (getattr(s, "name", "") or "").strip()
-                    if excl_ad and re_ad.match(nm):
-                        continue
-                    if excl_vdash and re_vdash.match(nm):
-                        continue
-                    filtered.append(s)
-                systems = filtered
-            pct = float(getattr(prefs, "build_percentage", 1.0) or 1.0)
-            pct = max(0.01, min(1.0, pct))
+                systems = filter_excluded_systems(systems, excl_ad, excl_vdash)
+            pct = max(0.01, min(1.0, float(getattr(prefs, "build_percentage", 1.0) or 1.0)))
             if pct < 0.9999:
                 # reproducible slice using deterministic shuffle copy
                 subset = systems[:]
@@ -121,14 +139,13 @@ if bpy:
             self._radius = float(getattr(prefs, "system_point_radius", 2.0) or 2.0)
             self._scale = float(getattr(prefs, "scale_factor", 1.0) or 1.0)
             # Black hole visual scale multiplier (applied to object.scale for BH systems)
-            try:
-                self._blackhole_scale_multiplier = float(
-                    getattr(prefs, "blackhole_scale_multiplier", 1.0) or 1.0
-                )
-            except (TypeError, ValueError):
-                self._blackhole_scale_multiplier = 1.0
+            self._blackhole_scale_multiplier = float(
+                getattr(prefs, "blackhole_scale_multiplier", 1.0) or 1.0
+            )
             self._apply_axis = bool(getattr(prefs, "apply_axis_transform", False))
             self._hierarchy = bool(getattr(prefs, "build_region_hierarchy", False))
+            self._auto_apply = bool(getattr(prefs, "auto_apply_default_visualization", False))
+            self._locations = self._scaled_locations(systems)
             if self.clear_previous:
                 clear_generated()
             coll = get_or_create_collection("Frontier")
@@ -196,18 +213,13 @@ if bpy:
                     coll.hide_render = False
                 except AttributeError:
                     pass
-            # Optionally auto-apply default visualization
-            try:
-                prefs = get_prefs(context)
-                if getattr(prefs, "auto_apply_default_visualization", False):
-                    # Invoke shader apply operator (will choose default strategy if none selected)
-                    try:
-                        bpy.ops.eve.apply_shader_modal("INVOKE_DEFAULT")  # type: ignore[attr-defined]
-                    except (AttributeError, RuntimeError) as e:
-                        print(f"[EVEVisualizer][build] auto-apply shader failed: {e}")
-            except (AttributeError, TypeError):
-                # prefs unavailable or malformed - skip auto-apply
-                pass
+            # Optionally auto-apply default visualization (preference captured in _init)
+            if self._auto_apply:
+                # Invoke shader apply operator (will choose default strategy if none selected)
+                try:
+                    bpy.ops.eve.apply_shader_modal("INVOKE_DEFAULT")  # type: ignore[attr-defined]
+                except (AttributeError, RuntimeError) as e:
+                    print(f"[EVEVisualizer][build] auto-apply shader failed: {e}")
             # Keep generated collections hidden by default (SystemsByName controls visibility).
             # Collapse collections so only root + immediate children are visible by default.
             try:
@@ -229,26 +241,38 @@ if bpy:
         def modal(self, context, event):  # noqa: D401
             if event.type == "TIMER":
                 batch_end = min(self._index + self.batch_size, self._total)
-                coll = bpy.data.collections.get("Frontier") if bpy else None  # type: ignore[union-attr]
+                # Frontier is the flat link target and the hierarchy root; resolve it once per batch
+                coll = get_or_create_collection("Frontier")
                 created = 0
                 systems = self._systems or []
-                for i in range(self._index, batch_end):
-                    if i >= len(systems):
-                        break
+                locations = self._locations or []
+                # Objects are created and linked first; custom properties are written in a
+                # second tight pass over this batch (values computed once, never read back).
+                batch = []
+                # Loop invariants bound once per batch rather than re-resolved per system
+                new_object = bpy.data.objects.new  # type: ignore[union-attr]
+                mesh = self._mesh
+                hierarchy = self._hierarchy
+                bh_scale = getattr(self, "_blackhole_scale_multiplier", 1.0)
+                bh_pattern_idx = getattr(
+                    self, "_blackhole_pattern_idx", DEFAULT_BLACKHOLE_PATTERN_IDX
+                )
+                pattern_colls = getattr(self, "_systems_by_name_children", {})
+                link_flat = coll.objects.link if coll and not hierarchy else None
+                for i in range(self._index, min(batch_end, len(systems))):
                     sys = systems[i]
-                    x, y, z = sys.x * self._scale, sys.y * self._scale, sys.z * self._scale
-                    if self._apply_axis:  # Rx-90 transformation (X,Y,Z) -> (X,Z,-Y)
-                        x, y, z = x, z, -y
-                    obj = bpy.data.objects.new(sys.name or f"System_{i}", self._mesh)  # type: ignore[union-attr]
-                    obj.location = (x, y, z)
+                    # Read the name once; the System_<i> fallback is only formatted when needed
+                    system_name = sys.name or ""
+                    obj = new_object(system_name or f"System_{i}", mesh)
+                    obj.location = locations[i]
+                    name_pattern = calculate_name_pattern_category(system_name)
+                    is_bh = is_blackhole_system(sys.id)
+                    batch.append((obj, sys, system_name, name_pattern, is_bh))
 
                     # Apply black hole scale multiplier to the object transform if applicable.
                     try:
-                        if (
-                            is_blackhole_system(sys.id)
-                            and getattr(self, "_blackhole_scale_multiplier", 1.0) != 1.0
-                        ):
-                            m = float(getattr(self, "_blackhole_scale_multiplier", 1.0))
+                        if is_bh and bh_scale != 1.0:
+                            m = float(bh_scale)
                             # Uniform scale (do not modify mesh data - scale on object)
                             obj.scale = (m, m, m)
                     except (TypeError, ValueError, AttributeError, RuntimeError) as e:
@@ -257,58 +281,25 @@ if bpy:
                             f"[EVEVisualizer][build] blackhole scale skip for {getattr(sys,'name',repr(sys))}: {e}"
                         )
 
-                    # Store visualization properties (for shader-driven strategies)
-                    system_name = sys.name or ""
-                    planet_count, moon_count = calculate_child_metrics(sys.planets)
-
-                    # Legacy count properties (kept for backward compat)
-                    obj["planet_count"] = planet_count
-                    obj["moon_count"] = moon_count
-
-                    # Semantic properties for instant shader switching
-                    obj["eve_system_id"] = sys.id  # System ID for jump line lookups
-                    obj["eve_name_pattern"] = calculate_name_pattern_category(system_name)
-                    obj["eve_name_char_bucket"] = calculate_name_char_bucket(system_name)
-                    obj["eve_planet_count"] = planet_count
-                    obj["eve_moon_count"] = moon_count
-                    obj["eve_npc_station_count"] = sys.npc_station_count
-                    obj["eve_is_blackhole"] = 1 if is_blackhole_system(sys.id) else 0
-
-                    # Character index properties (first 10 chars, normalized ordinals)
-                    # -1.0 = non-alphanumeric/missing, 0.0-1.0 = alphanumeric position
-                    char_indices = calculate_char_indices(system_name, max_chars=10)
-                    for char_idx, ord_val in enumerate(char_indices):
-                        obj[f"eve_name_char_index_{char_idx}_ord"] = ord_val
-
-                    # Proper noun flag (first char uppercase letter, rest letters/spaces)
-                    obj["eve_is_proper_noun"] = 1 if is_proper_noun(system_name) else 0
-
                     # Optional hierarchy collections
                     const_coll = None
-                    if self._hierarchy:
+                    if hierarchy:
                         region_name = getattr(sys, "region_name", None) or "UnknownRegion"
                         const_name = (
                             getattr(sys, "constellation_name", None) or "UnknownConstellation"
                         )
 
-                        def _san(s: str) -> str:
-                            return "".join(c if c.isalnum() or c in ("_", "-") else "_" for c in s)[
-                                :64
-                            ]
-
-                        region_key = _san(region_name)
-                        const_key = _san(const_name)
+                        region_key = _sanitize_collection_name(region_name)
+                        const_key = _sanitize_collection_name(const_name)
                         if self._region_cache is None:
                             # cache structure: { region_key: { 'coll': <Collection>, 'const': { const_key: <Collection> } } }
                             self._region_cache = {}
-                        # Root for hierarchy is the main Frontier collection (nested structure)
-                        root = get_or_create_collection("Frontier")
                         cache_entry = (
                             self._region_cache.get(region_key) if self._region_cache else None
                         )
                         if not cache_entry:
                             reg_coll = (
-                                get_or_create_subcollection(root, region_key) if root else None
+                                get_or_create_subcollection(coll, region_key) if coll else None
                             )
                             # Hide region collection on creation so SystemsByName visibility takes precedence
                             try:
@@ -342,7 +333,7 @@ if bpy:
                                 pass
                             if cache_entry:
                                 const_map[const_key] = const_coll
-                    if self._hierarchy:
+                    if hierarchy:
                         if const_coll is not None:
                             try:
                                 const_coll.objects.link(obj)
@@ -353,24 +344,12 @@ if bpy:
                             except AttributeError:
                                 pass
                     else:
-                        if coll:
-                            coll.objects.link(obj)
+                        if link_flat:
+                            link_flat(obj)
                     # Also link object into SystemsByName/<pattern> collection
-                    # Black holes are a special-case bucket regardless of name pattern
-                    # Convert the stored eve_is_blackhole flag to an int with a
-                    # deterministic fallback (0) if missing or malformed.
-                    try:
-                        is_bh = int(obj.get("eve_is_blackhole", 0))
-                    except (TypeError, ValueError):
-                        is_bh = 0
-                    if is_bh:
-                        # Use the persisted blackhole pattern index determined at init
-                        pattern_idx = getattr(
-                            self, "_blackhole_pattern_idx", DEFAULT_BLACKHOLE_PATTERN_IDX
-                        )
-                    else:
-                        pattern_idx = obj.get("eve_name_pattern", DEFAULT_OTHER_PATTERN_IDX)
-                    pattern_coll = getattr(self, "_systems_by_name_children", {}).get(pattern_idx)
+                    # Black holes use the bucket index persisted at init regardless of name pattern
+                    pattern_idx = bh_pattern_idx if is_bh else name_pattern
+                    pattern_coll = pattern_colls.get(pattern_idx)
                     if pattern_coll is not None:
                         # Avoid duplicate link exceptions
                         try:
@@ -382,6 +361,37 @@ if bpy:
                         except AttributeError:
                             pass
                     created += 1
+
+                for obj, sys, system_name, name_pattern, is_bh in batch:
+                    # Store visualization properties (counts precomputed by the loader).
+                    # Built as one dict and written with a single IDPropertyGroup.update()
+                    # instead of one obj[key] RNA assignment per property.
+                    planet_count, moon_count = sys.planet_count, sys.moon_count
+                    props = {
+                        # Legacy count properties (kept for backward compat)
+                        "planet_count": planet_count,
+                        "moon_count": moon_count,
+                        # Semantic properties for instant shader switching
+                        "eve_system_id": sys.id,  # System ID for jump line lookups
+                        "eve_name_pattern": name_pattern,
+                        "eve_name_char_bucket": calculate_name_char_bucket(system_name),
+                        "eve_planet_count": planet_count,
+                        "eve_moon_count": moon_count,
+                        "eve_npc_station_count": sys.npc_station_count,
+                        "eve_is_blackhole": 1 if is_bh else 0,
+                    }
+                    # Character index properties (first 10 chars, normalized ordinals)
+                    # -1.0 = non-alphanumeric/missing, 0.0-1.0 = alphanumeric position
+                    props.update(
+                        zip(
+                            _CHAR_INDEX_KEYS,
+                            calculate_char_indices(system_name, max_chars=len(_CHAR_INDEX_KEYS)),
+                            strict=True,
+                        )
+                    )
+                    # Proper noun flag (first char uppercase letter, rest letters/spaces)
+                    props["eve_is_proper_noun"] = 1 if is_proper_noun(system_name) else 0
+                    obj.id_properties_ensure().update(props)
                 self._index = batch_end
                 wm = context.window_manager
                 wm.eve_build_created += created
@@ -415,16 +425,16 @@ def register():  # pragma: no cover
     bpy.utils.register_class(EVE_OT_cancel_build)
     # Progress properties on WindowManager (created once)
     wm = bpy.types.WindowManager
-    if not hasattr(wm, "eve_build_in_progress"):
-        wm.eve_build_in_progress = bpy.props.BoolProperty(default=False)  # type: ignore
-    if not hasattr(wm, "eve_build_progress"):
-        wm.eve_build_progress = bpy.props.FloatProperty(default=0.0)  # type: ignore
-    if not hasattr(wm, "eve_build_total"):
-        wm.eve_build_total = bpy.props.IntProperty(default=0)  # type: ignore
-    if not hasattr(wm, "eve_build_created"):
-        wm.eve_build_created = bpy.props.IntProperty(default=0)  # type: ignore
-    if not hasattr(wm, "eve_build_mode"):
-        wm.eve_build_mode = bpy.props.StringProperty(default="")  # type: ignore
+    props = bpy.props
+    for name, prop, default in (
+        ("eve_build_in_progress", props.BoolProperty, False),
+        ("eve_build_progress", props.FloatProperty, 0.0),
+        ("eve_build_total", props.IntProperty, 0),
+        ("eve_build_created", props.IntProperty, 0),
+        ("eve_build_mode", props.StringProperty, ""),
+    ):
+        if not hasattr(wm, name):
+            setattr(wm, name, prop(default=default))
 
 
 def unregister():  # pragma: no cover
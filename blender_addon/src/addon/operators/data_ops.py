@@ -11,7 +11,7 @@ except (ImportError, ModuleNotFoundError):  # noqa: BLE001
 import sqlite3
 
 from .. import data_state
-from ..data_loader import load_data, load_jumps
+from ..data_loader import clear_cache, load_data, load_jumps
 from ..preferences import get_prefs
 from ._shared import clear_generated
 
@@ -47,15 +47,23 @@ if bpy:  # Only define classes when Blender API is present
         )
 
         def execute(self, context):  # noqa: D401
+            # Read preferences once; RNA lookups are not free and values cannot change mid-execute
             prefs = get_prefs(context)
             db_path = prefs.db_path
+            use_cache = bool(getattr(prefs, "enable_cache", True))
+            use_disk_cache = bool(getattr(prefs, "enable_disk_cache", False))
             if not os.path.exists(db_path):
                 self.report({"ERROR"}, f"DB not found: {db_path}")
                 return {"CANCELLED"}
             limit_val = int(getattr(self, "limit_systems", 0) or 0)
             limit_arg = limit_val if limit_val > 0 else None
             try:
-                systems = load_data(db_path, limit_systems=limit_arg)
+                systems = load_data(
+                    db_path,
+                    limit_systems=limit_arg,
+                    enable_cache=use_cache,
+                    disk_cache=use_disk_cache,
+                )
                 # Load jumps for these systems
                 system_ids = [s.id for s in systems]
                 jumps = load_jumps(db_path, system_ids=system_ids)
@@ -71,9 +79,12 @@ if bpy:  # Only define classes when Blender API is present
                 self.report({"ERROR"}, f"Load failed: {e}")
                 return {"CANCELLED"}
             data_state.set_loaded_systems(systems)
-            total_planets = sum(len(s.planets) for s in systems)
-            total_moons = sum(len(p.moons) for s in systems for p in s.planets)
-            total_stations = sum(s.npc_station_count for s in systems)
+            # Per-system counts are precomputed by the loader; no nested planet/moon walk
+            total_planets = total_moons = total_stations = 0
+            for s in systems:
+                total_planets += s.planet_count
+                total_moons += s.moon_count
+                total_stations += s.npc_station_count
             self.report(
                 {"INFO"},
                 f"Loaded {len(systems)} systems / {total_planets} planets / {total_moons} moons / {total_stations} npc stations / {len(jumps)} jumps",
@@ -89,6 +100,8 @@ def register():  # pragma: no cover
 
 
 def unregister():  # pragma: no cover
+    # Release cached SQLite handles so static.db can be replaced (Windows locks open files)
+    clear_cache()
     if not bpy:
         return
     bpy.utils.unregister_class(EVE_OT_load_data)
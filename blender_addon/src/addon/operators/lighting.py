@@ -7,6 +7,8 @@ try:  # pragma: no cover
 except (ImportError, ModuleNotFoundError):  # noqa: BLE001
     bpy = None  # type: ignore
 
+from ._shared import remove_objects
+
 if bpy:  # Only define classes when Blender API is present
 
     class EVE_OT_add_blackhole_lights(bpy.types.Operator):  # type: ignore[misc,name-defined]
@@ -71,8 +73,7 @@ if bpy:  # Only define classes when Blender API is present
                 frontier.children.link(lights_coll)
             else:
                 # Clear existing lights
-                for obj in list(lights_coll.objects):
-                    bpy.data.objects.remove(obj, do_unlink=True)  # type: ignore[attr-defined]
+                remove_objects(lights_coll.objects)
 
             # Create a bright point light at each black hole position
             created_count = 0
@@ -128,8 +129,7 @@ if bpy:  # Only define classes when Blender API is present
                 return {"CANCELLED"}
 
             # Remove all objects in the collection
-            for obj in list(lights_coll.objects):
-                bpy.data.objects.remove(obj, do_unlink=True)  # type: ignore[attr-defined]
+            remove_objects(lights_coll.objects)
 
             # Remove the collection itself
             bpy.data.collections.remove(lights_coll)  # type: ignore[attr-defined]
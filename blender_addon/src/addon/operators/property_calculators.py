@@ -7,6 +7,8 @@ these properties for instant strategy switching without Python iteration.
 
 from __future__ import annotations
 
+import re
+
 
 def calculate_char_indices(name: str, max_chars: int = 10) -> list[float]:
     """Calculate normalized ordinal values for first N characters.
@@ -132,20 +134,6 @@ def calculate_name_char_bucket(name: str) -> int:
     return -1
 
 
-def calculate_child_metrics(planets: list) -> tuple[int, int]:
-    """Calculate planet and moon counts from system data.
-
-    Args:
-        planets: List of Planet dataclass instances with .moons attribute
-
-    Returns:
-        Tuple of (planet_count, moon_count)
-    """
-    planet_count = len(planets)
-    moon_count = sum(len(p.moons) for p in planets)
-    return planet_count, moon_count
-
-
 # Blackhole detection - IDs are universal constants
 _BLACKHOLE_IDS = frozenset([30000001, 30000002, 30000003])
 
@@ -188,3 +176,33 @@ def is_proper_noun(name: str) -> bool:
         if not ch.isalpha():
             return False
     return True
+
+
+# Build-time exclusion patterns (compiled once; names are stripped before matching)
+_AD_NAME_RE = re.compile(r"^AD\d{3}$", re.IGNORECASE)
+_VDASH_NAME_RE = re.compile(r"^V-\d{3}$", re.IGNORECASE)
+_AD_OR_VDASH_NAME_RE = re.compile(r"^(?:AD|V-)\d{3}$", re.IGNORECASE)
+
+
+def filter_excluded_systems(
+    systems: list, exclude_ad: bool = False, exclude_vdash: bool = False
+) -> list:
+    """Drop systems whose names match the enabled exclusion patterns.
+
+    Args:
+        systems: System instances (anything with a .name attribute)
+        exclude_ad: Drop ADnnn systems (e.g. "AD042")
+        exclude_vdash: Drop V-nnn systems (e.g. "V-017")
+
+    Returns:
+        New list of the kept systems, original order preserved
+    """
+    if exclude_ad and exclude_vdash:
+        match = _AD_OR_VDASH_NAME_RE.match
+    elif exclude_ad:
+        match = _AD_NAME_RE.match
+    elif exclude_vdash:
+        match = _VDASH_NAME_RE.match
+    else:
+        return list(systems)
+    return [s for s in systems if not match((getattr(s, "name", "") or "").strip())]
@@ -13,6 +13,7 @@ except (ImportError, ModuleNotFoundError):  # noqa: BLE001
 
 from .. import data_state
 from ..preferences import get_prefs
+from ._shared import remove_objects
 
 if bpy:  # Only define classes when Blender API is present
 
@@ -73,8 +74,7 @@ if bpy:  # Only define classes when Blender API is present
                 frontier.children.link(ref_coll)
             else:
                 # Clear existing labels
-                for obj in list(ref_coll.objects):
-                    bpy.data.objects.remove(obj, do_unlink=True)  # type: ignore[attr-defined]
+                remove_objects(ref_coll.objects)
 
             created_count = 0
             prefs = get_prefs(context)
@@ -290,8 +290,7 @@ if bpy:  # Only define classes when Blender API is present
             ref_coll = bpy.data.collections.get("EVE_ReferencePoints")  # type: ignore[union-attr]
             if ref_coll:
                 # Remove all objects
-                for obj in list(ref_coll.objects):
-                    bpy.data.objects.remove(obj, do_unlink=True)  # type: ignore[attr-defined]
+                remove_objects(ref_coll.objects)
 
                 # Remove collection
                 bpy.data.collections.remove(ref_coll)  # type: ignore[union-attr]
@@ -12,33 +12,63 @@ from typing import Optional
 
 from ..node_groups import ensure_strategy_node_groups
 
+# Enum items for node-based strategies. Built once and returned by the items callback on
+# every UI redraw: Blender requires callback item strings to stay referenced from Python.
+_NODE_STRATEGY_ITEMS = [
+    (
+        "UniformOrange",
+        "Uniform Orange",
+        "All stars with uniform orange-red color",
+    ),
+    (
+        "CharacterRainbow",
+        "Character Rainbow",
+        "Color from first character, brightness from child count",
+    ),
+    ("PatternCategories", "Pattern Categories", "Distinct colors per naming pattern"),
+    (
+        "PositionEncoding",
+        "Position Encoding",
+        "RGB from first 3 characters, blackhole boost",
+    ),
+    (
+        "ProperNounHighlight",
+        "Proper Noun Highlight",
+        "Highlight systems whose names are proper nouns",
+    ),
+]
+
+# StrategySelector value per strategy id: the material's mix chain picks strategies in
+# _NODE_STRATEGY_ITEMS order (0=UniformOrange ... 4=ProperNounHighlight).
+_STRATEGY_SELECTOR_VALUES = {item[0]: float(i) for i, item in enumerate(_NODE_STRATEGY_ITEMS)}
+# Strategy id -> node group name, for re-linking GROUP nodes after reloads.
+_STRATEGY_NODE_GROUPS = {item[0]: f"EVE_Strategy_{item[0]}" for item in _NODE_STRATEGY_ITEMS}
+
 if bpy:
 
     def _node_strategy_enum_items(self, context):  # pragma: no cover
-        """Enum items for node-based strategies."""
-        return [  # type: ignore
-            (
-                "UniformOrange",
-                "Uniform Orange",
-                "All stars with uniform orange-red color",
-            ),
-            (
-                "CharacterRainbow",
-                "Character Rainbow",
-                "Color from first character, brightness from child count",
-            ),
-            ("PatternCategories", "Pattern Categories", "Distinct colors per naming pattern"),
-            (
-                "PositionEncoding",
-                "Position Encoding",
-                "RGB from first 3 characters, blackhole boost",
-            ),
-            (
-                "ProperNounHighlight",
-                "Proper Noun Highlight",
-                "Highlight systems whose names are proper nouns",
-            ),
-        ]
+        """Enum items for node-based strategies (shared module-level list)."""
+        return _NODE_STRATEGY_ITEMS
+
+    def _assign_material(objs, mat, tag: str) -> None:  # pragma: no cover
+        """Put ``mat`` in slot 0 of each distinct mesh used by ``objs``.
+
+        Material slots are linked to object data, and generated systems share one template
+        mesh, so writing once per mesh replaces one RNA write per object.
+        """
+        meshes = {}
+        for o in objs:
+            data = getattr(o, "data", None)
+            if data is not None and hasattr(data, "materials"):
+                meshes.setdefault(data.as_pointer(), (o, data))
+        for o, data in meshes.values():
+            try:
+                if data.materials:
+                    data.materials[0] = mat
+                else:
+                    data.materials.append(mat)
+            except (AttributeError, RuntimeError, TypeError) as e:  # noqa: BLE001
+                print(f"[EVEVisualizer][{tag}] Failed on object {getattr(o, 'name', repr(o))}: {e}")
 
     class EVE_OT_apply_shader_modal(bpy.types.Operator):  # type: ignore
         bl_idname = "eve.apply_shader_modal"
@@ -369,14 +399,9 @@ if bpy:
                         # Update strategy selector value (if present)
                         selector = nt.nodes.get("StrategySelector")
                         if selector:
-                            strategy_map = {
-                                "UniformOrange": 0.0,
-                                "CharacterRainbow": 1.0,
-                                "PatternCategories": 2.0,
-                                "PositionEncoding": 3.0,
-                                "ProperNounHighlight": 4.0,
-                            }
-                            selector.outputs[0].default_value = strategy_map.get(strategy_name, 0.0)
+                            selector.outputs[0].default_value = _STRATEGY_SELECTOR_VALUES.get(
+                                strategy_name, 0.0
+                            )
                 except (AttributeError, RuntimeError, TypeError) as e:
                     # Non-fatal: if anything goes wrong here, leave existing material as-is
                     print(
@@ -393,36 +418,14 @@ if bpy:
             mat = self._ensure_attribute_material()
             if mat is None:
                 return
-            for o in objs:
-                try:
-                    if getattr(o, "data", None) and hasattr(o.data, "materials"):
-                        if o.data.materials:
-                            o.data.materials[0] = mat
-                        else:
-                            o.data.materials.append(mat)
-                except (AttributeError, RuntimeError, TypeError) as e:  # noqa: BLE001
-                    print(
-                        f"[EVEVisualizer][apply_attr_mat] Failed on object {getattr(o,'name',repr(o))}: {e}"
-                    )
-                    continue
+            _assign_material(objs, mat, "apply_attr_mat")
 
         def _apply_node_group_material(self, objs, strategy_name: str):
             """Apply node group material to objects with specified strategy active."""
             mat = self._ensure_node_group_material(strategy_name)
             if mat is None:
                 return
-            for o in objs:
-                try:
-                    if getattr(o, "data", None) and hasattr(o.data, "materials"):
-                        if o.data.materials:
-                            o.data.materials[0] = mat
-                        else:
-                            o.data.materials.append(mat)
-                except (AttributeError, RuntimeError, TypeError) as e:  # noqa: BLE001
-                    print(
-                        f"[EVEVisualizer][apply_node_mat] Failed on object {getattr(o,'name',repr(o))}: {e}"
-                    )
-                    continue
+            _assign_material(objs, mat, "apply_node_mat")
 
         def execute(self, context):  # noqa: D401
             # Get selected strategy from scene property (with fallback)
@@ -655,15 +658,7 @@ def _on_strategy_param_change(self, context):  # pragma: no cover
         nodes = mat.node_tree.nodes
 
         # Re-link all node group references to ensure they're up-to-date
-        node_group_map = {
-            "UniformOrange": "EVE_Strategy_UniformOrange",
-            "CharacterRainbow": "EVE_Strategy_CharacterRainbow",
-            "PatternCategories": "EVE_Strategy_PatternCategories",
-            "PositionEncoding": "EVE_Strategy_PositionEncoding",
-            "ProperNounHighlight": "EVE_Strategy_ProperNounHighlight",
-        }
-
-        for node_name, ng_name in node_group_map.items():
+        for node_name, ng_name in _STRATEGY_NODE_GROUPS.items():
             node = nodes.get(node_name)
             if node and node.type == "GROUP":
                 # Always refresh the reference to pick up node group changes
@@ -725,16 +720,7 @@ def _on_strategy_change(self, context):  # pragma: no cover
                         print(f"  {key}: {sample_obj[key]}")
 
             # Assign material to all systems
-            for obj in systems:
-                try:
-                    if getattr(obj, "data", None) and hasattr(obj.data, "materials"):
-                        if obj.data.materials:
-                            obj.data.materials[0] = mat
-                        else:
-                            obj.data.materials.append(mat)
-                except (AttributeError, RuntimeError, TypeError):  # noqa: BLE001
-                    # Best-effort assignment failure - skip this object
-                    pass
+            _assign_material(systems, mat, "strategy_change")
     else:
         print("[EVEVisualizer][strategy_change] Material already exists, updating selector...")
 
@@ -768,16 +754,7 @@ def _on_strategy_change(self, context):  # pragma: no cover
 
                     _collect_recursive(frontier)
 
-                for obj in systems:
-                    try:
-                        if getattr(obj, "data", None) and hasattr(obj.data, "materials"):
-                            if obj.data.materials:
-                                obj.data.materials[0] = mat
-                            else:
-                                obj.data.materials.append(mat)
-                    except (AttributeError, RuntimeError, TypeError):  # noqa: BLE001
-                        # Best-effort assignment failure - skip this object
-                        pass
+                _assign_material(systems, mat, "strategy_change")
 
     # Update the StrategySelector value AND fix broken node group references
     if mat and mat.node_tree:
@@ -785,16 +762,8 @@ def _on_strategy_change(self, context):  # pragma: no cover
         links = mat.node_tree.links
 
         # Fix broken node group references (Missing Data nodes)
-        node_group_map = {
-            "UniformOrange": "EVE_Strategy_UniformOrange",
-            "CharacterRainbow": "EVE_Strategy_CharacterRainbow",
-            "PatternCategories": "EVE_Strategy_PatternCategories",
-            "PositionEncoding": "EVE_Strategy_PositionEncoding",
-            "ProperNounHighlight": "EVE_Strategy_ProperNounHighlight",
-        }
-
         needs_reconnect = False
-        for node_name, ng_name in node_group_map.items():
+        for node_name, ng_name in _STRATEGY_NODE_GROUPS.items():
             node = nodes.get(node_name)
             if node and node.type == "GROUP":
                 # Check if node_tree reference is broken (None)
@@ -877,14 +846,7 @@ def _on_strategy_change(self, context):  # pragma: no cover
 
         selector = mat.node_tree.nodes.get("StrategySelector")
         if selector:
-            strategy_map = {
-                "UniformOrange": 0.0,
-                "CharacterRainbow": 1.0,
-                "PatternCategories": 2.0,
-                "PositionEncoding": 3.0,
-                "ProperNounHighlight": 4.0,
-            }
-            new_value = strategy_map.get(strategy_name, 0.0)
+            new_value = _STRATEGY_SELECTOR_VALUES.get(strategy_name, 0.0)
             selector.outputs[0].default_value = new_value
             print(f"[EVEVisualizer][strategy_change] Updated StrategySelector to {new_value}")
         else:
@@ -2,11 +2,49 @@
 
 from __future__ import annotations
 
+import math
+from pathlib import Path
+
 try:  # pragma: no cover
     import bpy  # type: ignore
 except (ImportError, ModuleNotFoundError):
     bpy = None  # type: ignore
 
+# Sensor width (mm) Blender uses to turn the 3D viewport lens into a field of view
+_VIEW_SENSOR_WIDTH = 72.0
+
+# Bundled HDRI, resolved once relative to the addon root (three parents above
+# operators/); only its existence is checked per invocation
+_HDRI_PATH = Path(__file__).resolve().parents[3] / "hdris" / "HDR_multi_nebulae.hdr"
+
+
+def _fit_view_distance(
+    radius: float, lens: float, width: int, height: int, perspective: bool = True
+) -> float:
+    """Return the ``view_distance`` that fits a sphere of ``radius`` in a 3D viewport.
+
+    The viewport maps ``_VIEW_SENSOR_WIDTH`` to the region's larger side, so the field of
+    view along the smaller side is narrowed by ``min(w, h) / max(w, h)``. In orthographic
+    views ``view_distance`` sets the ortho scale: the visible half-extent is distance * tan.
+    """
+    tan_half = _VIEW_SENSOR_WIDTH / (2.0 * lens)
+    if width > 0 and height > 0:
+        tan_half *= min(width, height) / max(width, height)
+    if not perspective:
+        return radius / tan_half
+    return radius / math.sin(math.atan(tan_half))
+
+
+def _view3d_spaces(context) -> list:  # pragma: no cover - needs Blender
+    """Return every VIEW_3D space in the current screen."""
+    return [
+        space
+        for area in context.screen.areas
+        if area.type == "VIEW_3D"
+        for space in area.spaces
+        if space.type == "VIEW_3D"
+    ]
+
 
 if bpy:
 
@@ -42,13 +80,8 @@ if bpy:
         )
 
         def execute(self, context):  # noqa: D401
-            from pathlib import Path
-
-            # Resolve HDRI path relative to addon root (three parents from this file)
-            hdri_path = None
-            hdri_found = False
+            hdri_path = _HDRI_PATH
             try:
-                hdri_path = Path(__file__).resolve().parents[3] / "hdris" / "HDR_multi_nebulae.hdr"
                 hdri_found = hdri_path.exists()
             except (OSError, RuntimeError):
                 hdri_found = False
@@ -124,14 +157,18 @@ if bpy:
             nt = world.node_tree
             nodes = nt.nodes
             links = nt.links
-            out = next((n for n in nodes if n.type == "OUTPUT_WORLD"), None)
+            # First node of each type, found in one pass over the tree
+            first_by_type = {}
+            for n in nodes:
+                first_by_type.setdefault(n.type, n)
+            out = first_by_type.get("OUTPUT_WORLD")
             if not out:
                 out = nodes.new("ShaderNodeOutputWorld")
-            bg = next((n for n in nodes if n.type == "BACKGROUND"), None)
+            bg = first_by_type.get("BACKGROUND")
             if not bg:
                 bg = nodes.new("ShaderNodeBackground")
             bg.inputs[1].default_value = self.strength
-            env = next((n for n in nodes if n.type == "TEX_ENVIRONMENT"), None)
+            env = first_by_type.get("TEX_ENVIRONMENT")
             if not env:
                 env = nodes.new("ShaderNodeTexEnvironment")
                 env.location = (-400, 0)
@@ -158,14 +195,22 @@ if bpy:
                     except Exception:
                         # Assignment will raise if the enum value isn't available
                         continue
-            # Rewire links
+            # Rewire links unless env -> bg -> out is already the only wiring (socket-local check)
             try:
-                for link in list(env.outputs[0].links):
-                    nt.links.remove(link)
-                for link in list(bg.outputs[0].links):
-                    nt.links.remove(link)
-                links.new(env.outputs[0], bg.inputs[0])
-                links.new(bg.outputs[0], out.inputs[0])
+                env_links = env.outputs[0].links
+                bg_links = bg.outputs[0].links
+                if not (
+                    len(env_links) == 1
+                    and env_links[0].to_socket == bg.inputs[0]
+                    and len(bg_links) == 1
+                    and bg_links[0].to_socket == out.inputs[0]
+                ):
+                    for link in list(env_links):
+                        nt.links.remove(link)
+                    for link in list(bg_links):
+                        nt.links.remove(link)
+                    links.new(env.outputs[0], bg.inputs[0])
+                    links.new(bg.outputs[0], out.inputs[0])
             except (AttributeError, RuntimeError):
                 # Node trees can raise on missing sockets or invalid node types
                 pass
@@ -183,33 +228,33 @@ if bpy:
         )
 
         def execute(self, context):  # noqa: D401
-            for area in context.screen.areas:
-                if area.type != "VIEW_3D":
-                    continue
-                for space in area.spaces:
-                    if space.type == "VIEW_3D":
-                        space.clip_end = self.clip_end
+            for space in _view3d_spaces(context):
+                # Skip unchanged values: every RNA write notifies and redraws the area
+                if space.clip_end != self.clip_end:
+                    space.clip_end = self.clip_end
             self.report({"INFO"}, f"Clip end set to {self.clip_end}")
             return {"FINISHED"}
 
     class EVE_OT_viewport_hide_overlays(bpy.types.Operator):  # type: ignore
         bl_idname = "eve.viewport_hide_overlays"
         bl_label = "Hide Grid & Axis"
-        bl_description = "Toggle floor grid and coordinate axes visibility in all 3D viewports for cleaner visualization"
+        bl_description = "Toggle floor grid and X/Y axes in the first 3D viewport and apply the same visibility to all other 3D viewports"
         bl_options = {"REGISTER"}
 
         def execute(self, context):  # noqa: D401
+            spaces = _view3d_spaces(context)
+            # One target state for every view (taken from the first), so views end up in
+            # sync and overlays that already match are not rewritten
+            show = not spaces[0].overlay.show_floor if spaces else False
             toggled = 0
-            for area in context.screen.areas:
-                if area.type != "VIEW_3D":
-                    continue
-                for space in area.spaces:
-                    if space.type == "VIEW_3D":
-                        space.overlay.show_floor = not space.overlay.show_floor
-                        space.overlay.show_axis_x = not space.overlay.show_axis_x
-                        space.overlay.show_axis_y = not space.overlay.show_axis_y
-                        toggled += 1
-            self.report({"INFO"}, f"Toggled overlays in {toggled} view(s)")
+            for space in spaces:
+                overlay = space.overlay
+                for attr in ("show_floor", "show_axis_x", "show_axis_y"):
+                    if getattr(overlay, attr) != show:
+                        setattr(overlay, attr, show)
+                toggled += 1
+            state = "shown" if show else "hidden"
+            self.report({"INFO"}, f"Grid/axes {state} in {toggled} view(s) (synced to first view)")
             return {"FINISHED"}
 
     class EVE_OT_viewport_frame_all(bpy.types.Operator):  # type: ignore
@@ -219,41 +264,59 @@ if bpy:
         bl_options = {"REGISTER"}
 
         def execute(self, context):  # noqa: D401
-            # Find all system objects in the Frontier collection
-            systems = []
+            # All system objects in the Frontier collection tree (all_objects is resolved
+            # in C and already de-duplicates objects linked into several child collections)
             frontier = bpy.data.collections.get("Frontier")  # type: ignore[union-attr]
-            if frontier:
-
-                def _collect_recursive(collection):
-                    systems.extend(collection.objects)
-                    for child in collection.children:
-                        _collect_recursive(child)
-
-                _collect_recursive(frontier)
+            systems = frontier.all_objects if frontier else ()
 
             if not systems:
                 self.report({"WARNING"}, "No systems found in Frontier collection")
                 return {"CANCELLED"}
 
-            # Deselect all, then select all systems
-            try:
-                bpy.ops.object.select_all(action="DESELECT")
-                for obj in systems:
-                    obj.select_set(True)
+            # Bounds in one NumPy pass instead of selecting every object and letting
+            # view_selected walk the selection (deferred import: only needed here)
+            import numpy as np  # type: ignore
 
-                # Frame selected objects in all 3D viewports
+            coords = np.fromiter(
+                (c for obj in systems for c in obj.location),
+                dtype=np.float64,
+                count=len(systems) * 3,
+            ).reshape(-1, 3)
+            mins = coords.min(axis=0)
+            maxs = coords.max(axis=0)
+            center = tuple(((mins + maxs) * 0.5).tolist())
+            radius = max(float(np.linalg.norm(maxs - mins)) * 0.5, 1.0)
+
+            try:
+                framed = 0
+                camera_views = 0
                 for area in context.screen.areas:
                     if area.type != "VIEW_3D":
                         continue
-                    for region in area.regions:
-                        if region.type == "WINDOW":
-                            with context.temp_override(area=area, region=region):
-                                bpy.ops.view3d.view_selected()
-
-                # Deselect all systems after framing
-                bpy.ops.object.select_all(action="DESELECT")
-
-                self.report({"INFO"}, f"Framed {len(systems)} systems in viewport")
+                    space = area.spaces.active
+                    r3d = getattr(space, "region_3d", None)
+                    if r3d is None:
+                        continue
+                    if r3d.view_perspective == "CAMERA":
+                        # Looking through the scene camera: view_location/distance are unused
+                        camera_views += 1
+                        continue
+                    region = next((r for r in area.regions if r.type == "WINDOW"), None)
+                    r3d.view_location = center
+                    r3d.view_distance = _fit_view_distance(
+                        radius,
+                        space.lens,
+                        region.width if region else 0,
+                        region.height if region else 0,
+                        perspective=r3d.view_perspective == "PERSP",
+                    )
+                    framed += 1
+                    area.tag_redraw()
+
+                msg = f"Framed {len(systems)} systems in {framed} viewport(s)"
+                if camera_views:
+                    msg += f"; skipped {camera_views} camera view(s)"
+                self.report({"INFO"}, msg)
             except (
                 AttributeError,
                 RuntimeError,
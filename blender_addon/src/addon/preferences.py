@@ -52,6 +52,13 @@ def _default_db_path():
         return ""
 
 
+def _on_db_path_update(self, context):
+    """Drop loader caches (and their open SQLite handles) when the database path changes."""
+    from .data_loader import clear_cache
+
+    clear_cache()
+
+
 ENV_DB_VAR = "EVE_STATIC_DB"
 _ENV_DB_PATH = os.environ.get(ENV_DB_VAR)
 _DEFAULT_USER_DB = str(
@@ -109,6 +116,7 @@ class EVEVisualizerPreferences(_BasePrefs):
         subtype="FILE_PATH",
         default=_ENV_DB_PATH or "",  # empty if no ENV override
         description="Path to static.db (set here, use Locate, or define env EVE_STATIC_DB)",
+        update=_on_db_path_update,
     )
     scale_exponent: IntProperty(  # type: ignore[valid-type]
         name="Scale Exponent",
@@ -132,6 +140,13 @@ class EVEVisualizerPreferences(_BasePrefs):
         default=True,
         description="Cache parsed data in memory for faster rebuild",
     )
+    enable_disk_cache: BoolProperty(  # type: ignore[valid-type]
+        name="Enable Disk Cache",
+        default=False,
+        description=(
+            "Store parsed data as a snapshot next to the database so new sessions skip SQL parsing"
+        ),
+    )
     apply_axis_transform: BoolProperty(  # type: ignore[valid-type]
         name="Normalize Axis",
         default=True,  # Inverted default: now enabled by default
@@ -279,6 +294,7 @@ class EVEVisualizerPreferences(_BasePrefs):
         # Remaining properties (excluding scale_factor which is panel-only now)
         for prop_name in (
             "enable_cache",
+            "enable_disk_cache",
             "apply_axis_transform",
             "system_representation",
             "system_point_radius",
@@ -320,6 +336,7 @@ try:  # pragma: no cover - runtime safety
             subtype="FILE_PATH",
             default=_ENV_DB_PATH or "",
             description="Path to static.db (set here, use Locate, or define env EVE_STATIC_DB)",
+            update=_on_db_path_update,
         )
         _missing.append("db_path")
     if not hasattr(EVEVisualizerPreferences, "scale_exponent"):
@@ -342,6 +359,15 @@ try:  # pragma: no cover - runtime safety
             description="Cache parsed data in memory for faster rebuild",
         )
         _missing.append("enable_cache")
+    if not hasattr(EVEVisualizerPreferences, "enable_disk_cache"):
+        EVEVisualizerPreferences.enable_disk_cache = BoolProperty(  # type: ignore[attr-defined]
+            name="Enable Disk Cache",
+            default=False,
+            description=(
+                "Store parsed data as a snapshot next to the database so new sessions skip SQL parsing"
+            ),
+        )
+        _missing.append("enable_disk_cache")
     if not hasattr(EVEVisualizerPreferences, "apply_axis_transform"):
         EVEVisualizerPreferences.apply_axis_transform = BoolProperty(  # type: ignore[attr-defined]
             name="Normalize Axis",
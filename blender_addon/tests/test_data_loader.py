@@ -40,6 +40,17 @@ def test_limit_systems():
     assert len(systems) == 1
 
 
+def test_limit_systems_keeps_children_of_selected_systems():
+    """Limited loads join planets/moons against the selected systems only."""
+    path = build_temp_db()
+    full = load_data(path, enable_cache=False)
+    limited = load_data(path, limit_systems=1, enable_cache=False)
+    assert [p.id for p in limited[0].planets] == [p.id for p in full[0].planets]
+    assert [m.id for p in limited[0].planets for m in p.moons] == [
+        m.id for p in full[0].planets for m in p.moons
+    ]
+
+
 def test_cache_behavior():
     path = build_temp_db()
     systems1 = load_data(path, enable_cache=True)
@@ -85,6 +96,9 @@ def test_planet_properties():
     assert planet.name == "Alpha I"
     assert planet.orbit_index == 1
     assert planet.planet_type == "Gas"
+    # Repeated planet types share one interned string
+    beta = next(s for s in systems if s.id == 2)
+    assert beta.planets[0].planet_type is alpha.planets[1].planet_type
 
 
 def test_moon_properties():
@@ -205,6 +219,20 @@ def test_dataclass_immutability():
         if planet.moons:
             moon = planet.moons[0]
             assert hasattr(type(moon), "__slots__")
+            # Moons are immutable NamedTuples
+            with pytest.raises(AttributeError):
+                moon.name = "renamed"  # type: ignore[misc]
+
+
+def test_child_counts_precomputed():
+    """planet_count/moon_count are filled during load to match the nested lists."""
+    path = build_temp_db()
+    systems = load_data(path, enable_cache=False)
+    for system in systems:
+        assert system.planet_count == len(system.planets)
+        assert system.moon_count == sum(len(p.moons) for p in system.planets)
+    alpha = systems[0]
+    assert (alpha.planet_count, alpha.moon_count) == (2, 3)
 
 
 def test_npc_station_count():
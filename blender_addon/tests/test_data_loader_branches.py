@@ -163,7 +163,7 @@ def test_region_and_constellation_join_populates_names():
 
 
 def test_load_jumps_batching_over_large_id_list():
-    """Ensure the jumps loader batches IN queries when given a large list of system IDs."""
+    """Ensure the jumps loader keeps every edge within a large list of system IDs."""
     # build a DB with 460 systems and jumps linking i -> i+1
     n = 460
     parts = [
@@ -182,6 +182,10 @@ def test_load_jumps_batching_over_large_id_list():
     path = make_tmp_db(sql)
     system_ids = list(range(1, n + 1))
     jumps = load_jumps(path, system_ids=system_ids)
-    # We expect many jumps to be returned but batching can drop chunk-boundary edges;
-    # assert we received a non-empty subset and fewer than the full (n) entries.
-    assert 0 < len(jumps) < n
+    # Every i -> i+1 edge has both endpoints selected, so none may be dropped
+    assert len(jumps) == n - 1
+    assert {(j.from_system_id, j.to_system_id) for j in jumps} == {(i, i + 1) for i in range(1, n)}
+
+    # Jumps leaving the selection are excluded; duplicate ids are tolerated
+    subset = load_jumps(path, system_ids=[1, 2, 3, 3])
+    assert sorted((j.from_system_id, j.to_system_id) for j in subset) == [(1, 2), (2, 3)]
@@ -1,9 +1,11 @@
+import os
 import sqlite3
 import tempfile
 from pathlib import Path
 
 import pytest
 
+from addon import data_loader
 from addon.data_loader import (
     _column_lookup,
     _resolve_table_names,
@@ -32,6 +34,8 @@ def test_column_lookup_basic():
     # Candidates that aren't present should return None
     assert resolve(("x", "posx")) is None
     assert resolve(("nonexistent",)) is None
+    # The same column layout reuses one memoised resolver
+    assert _column_lookup(list(cols)) is resolve
 
 
 def test_resolve_table_names_raises_when_missing():
@@ -140,7 +144,7 @@ def test_security_parsing_valid_value():
 
 
 def test_load_jumps_batching_with_system_ids():
-    # Build a DB with 920 systems and jumps linking i -> i+1 to force batching (batch_size=450)
+    # Build a DB with 920 systems and jumps linking i -> i+1
     n = 920
     parts = [
         "CREATE TABLE SolarSystems (solarSystemId INTEGER PRIMARY KEY, name TEXT, centerX REAL, centerY REAL, centerZ REAL);",
@@ -160,3 +164,206 @@ def test_load_jumps_batching_with_system_ids():
     jumps = load_jumps(path, system_ids=system_ids)
     assert isinstance(jumps, list)
     assert len(jumps) > 0
+
+
+_DISK_CACHE_SQL = """
+CREATE TABLE SolarSystems (solarSystemId INTEGER PRIMARY KEY, name TEXT, centerX REAL, centerY REAL, centerZ REAL);
+CREATE TABLE Planets (planetId INTEGER PRIMARY KEY, solarSystemId INTEGER, planetName TEXT);
+CREATE TABLE Moons (moonId INTEGER PRIMARY KEY, planetId INTEGER, moonName TEXT);
+CREATE TABLE Jumps (fromSystemId INTEGER, toSystemId INTEGER);
+CREATE TABLE NpcStations (stationId INTEGER PRIMARY KEY, solarSystemId INTEGER);
+INSERT INTO SolarSystems VALUES (1, 'S1', 1,2,3);
+INSERT INTO Planets VALUES (10, 1, 'P1');
+INSERT INTO Moons VALUES (100, 10, 'M1');
+"""
+
+
+def test_disk_cache_roundtrip_skips_sql(tmp_path, monkeypatch):
+    path = tmp_path / "static.db"
+    with sqlite3.connect(path) as con:
+        con.executescript(_DISK_CACHE_SQL)
+    first = load_data(path, enable_cache=False, disk_cache=True)
+    assert len(list(tmp_path.glob("static.db.cache-*.json"))) == 1
+
+    def _no_sql(*_args, **_kwargs):
+        raise AssertionError("SQLite should not be opened when the snapshot is fresh")
+
+    monkeypatch.setattr(data_loader.sqlite3, "connect", _no_sql)
+    second = load_data(path, enable_cache=False, disk_cache=True)
+    assert second is not first
+    assert second[0].planets[0].moons[0].name == "M1"
+    assert (second[0].x, second[0].planet_count, second[0].moon_count) == (1.0, 1, 1)
+    assert second[0].planets[0].moons[0] == first[0].planets[0].moons[0]
+
+
+def test_disk_cache_replaces_stale_snapshots(tmp_path):
+    path = tmp_path / "static.db"
+    with sqlite3.connect(path) as con:
+        con.executescript(_DISK_CACHE_SQL)
+    load_data(path, enable_cache=False, disk_cache=True)
+    with sqlite3.connect(path) as con:
+        con.execute("INSERT INTO SolarSystems VALUES (2, 'S2', 0,0,0)")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    systems = load_data(path, enable_cache=False, disk_cache=True)
+    assert [s.name for s in systems] == ["S1", "S2"]
+    assert len(list(tmp_path.glob("static.db.cache-*.json"))) == 1
+
+
+def test_disk_cache_stale_cleanup_matches_fields_exactly(tmp_path):
+    path = tmp_path / "static.db"
+    with sqlite3.connect(path) as con:
+        con.executescript(_DISK_CACHE_SQL)
+    load_data(path, enable_cache=False, disk_cache=True)
+    (current,) = tmp_path.glob("static.db.cache-*.json")
+    # Same version/size, but an mtime that merely starts with the current one
+    version, size, mtime, limit = current.name[len("static.db.cache-") : -len(".json")].split("-")
+    lookalike = tmp_path / f"static.db.cache-{version}-{size}-{mtime}3-{limit}.json"
+    lookalike.write_text("[]")
+    legacy = tmp_path / f"static.db.cache-v2-{size}-{mtime}-{limit}.pkl"
+    legacy.write_bytes(b"legacy pickle")
+    # A different limit writes a second snapshot, which runs the cleanup
+    load_data(path, enable_cache=False, disk_cache=True, limit_systems=1)
+    assert current.exists()
+    assert not lookalike.exists()
+    assert not legacy.exists()
+
+
+def test_disk_cache_failed_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    path = tmp_path / "static.db"
+    with sqlite3.connect(path) as con:
+        con.executescript(_DISK_CACHE_SQL)
+
+    def _disk_full(_obj, fh, **_kwargs):
+        fh.write("[[1,")
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(data_loader.json, "dump", _disk_full)
+    systems = load_data(path, enable_cache=False, disk_cache=True)
+    assert [s.name for s in systems] == ["S1"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["static.db"]
+
+
+def test_disk_cache_ignores_corrupt_snapshot(tmp_path):
+    path = tmp_path / "static.db"
+    with sqlite3.connect(path) as con:
+        con.executescript(_DISK_CACHE_SQL)
+    load_data(path, enable_cache=False, disk_cache=True)
+    (snapshot,) = tmp_path.glob("static.db.cache-*.json")
+    snapshot.write_bytes(b"not json")
+    systems = load_data(path, enable_cache=False, disk_cache=True)
+    assert [s.name for s in systems] == ["S1"]
+
+
+def test_memory_cache_is_bounded_lru(tmp_path):
+    path = tmp_path / "static.db"
+    with sqlite3.connect(path) as con:
+        con.executescript(_DISK_CACHE_SQL)
+    clear_cache()
+    first = load_data(path, limit_systems=1)
+    for limit in range(2, data_loader.CACHE_MAX_ENTRIES + 1):
+        load_data(path, limit_systems=limit)
+    # Touch the first entry so it becomes most recently used, then overflow the cache
+    assert load_data(path, limit_systems=1) is first
+    load_data(path, limit_systems=None)
+    assert len(data_loader._cache) == data_loader.CACHE_MAX_ENTRIES
+    assert load_data(path, limit_systems=1) is first
+    clear_cache()
+
+
+def test_read_pragmas_env_overrides(monkeypatch):
+    monkeypatch.setenv(data_loader.ENV_SQLITE_MMAP_BYTES, "0")
+    monkeypatch.setenv(data_loader.ENV_SQLITE_CACHE_KIB, "2048")
+    pragmas = data_loader._read_pragmas()
+    assert "PRAGMA mmap_size=0" in pragmas
+    assert "PRAGMA cache_size=-2048" in pragmas
+
+    monkeypatch.setenv(data_loader.ENV_SQLITE_CACHE_KIB, "lots")
+    pragmas = data_loader._read_pragmas()
+    assert f"PRAGMA cache_size=-{data_loader.DEFAULT_SQLITE_CACHE_KIB}" in pragmas
+
+
+def test_schema_introspection_memoised_per_file(tmp_path, monkeypatch):
+    path = tmp_path / "static.db"
+    with sqlite3.connect(path) as con:
+        con.executescript(_DISK_CACHE_SQL)
+    clear_cache()
+    load_data(path, enable_cache=False)
+    (schema,) = data_loader._schema_cache.values()
+    assert {"SolarSystems", "Planets", "Moons"} <= set(schema.columns)
+
+    def _no_introspection(_cur):
+        raise AssertionError("table names should come from the schema cache")
+
+    monkeypatch.setattr(data_loader, "_resolve_table_names", _no_introspection)
+    systems = load_data(path, limit_systems=1, enable_cache=False)
+    assert systems[0].planets[0].moons[0].name == "M1"
+    assert load_jumps(path) == []
+    clear_cache()
+    assert not data_loader._schema_cache
+
+
+def test_read_connection_reused_until_file_changes(tmp_path):
+    path = tmp_path / "static.db"
+    with sqlite3.connect(path) as con:
+        con.executescript(_DISK_CACHE_SQL)
+    clear_cache()
+    load_data(path, enable_cache=False)
+    ((fid, con, immutable),) = data_loader._conn_cache.values()
+    assert immutable  # no -wal/-journal next to the file
+    assert con.isolation_level is None and not con.in_transaction
+    load_data(path, limit_systems=1, enable_cache=False)
+    load_jumps(path, system_ids=[1])
+    assert data_loader._conn_cache[fid[0]][1] is con
+    with pytest.raises(sqlite3.OperationalError):
+        con.execute("CREATE TABLE scratch (a)")  # opened read-only
+
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    load_data(path, enable_cache=False)
+    assert data_loader._conn_cache[fid[0]][1] is not con
+    with pytest.raises(sqlite3.ProgrammingError):
+        con.execute("SELECT 1")  # stale connection was closed
+    clear_cache()
+    assert not data_loader._conn_cache
+
+
+def test_read_connection_honours_wal_sidecar(tmp_path):
+    path = tmp_path / "static.db"
+    with sqlite3.connect(path) as con:
+        con.executescript(_DISK_CACHE_SQL)
+    clear_cache()
+    load_jumps(path)
+    ((_fid, first, immutable),) = data_loader._conn_cache.values()
+    assert immutable
+    # A writer switches to WAL and keeps uncheckpointed rows in the -wal file
+    writer = sqlite3.connect(path)
+    writer.execute("PRAGMA journal_mode=WAL")
+    writer.execute("PRAGMA wal_autocheckpoint=0")
+    writer.execute("INSERT INTO SolarSystems VALUES (2, 'S2', 0,0,0)")
+    writer.commit()
+    try:
+        systems = load_data(path, enable_cache=False)
+        assert [s.name for s in systems] == ["S1", "S2"]
+        ((_fid, con, immutable),) = data_loader._conn_cache.values()
+        assert not immutable and con is not first
+    finally:
+        clear_cache()
+        writer.close()
+
+
+def test_db_path_change_releases_connection(tmp_path):
+    from addon.preferences import _on_db_path_update
+
+    path = tmp_path / "static.db"
+    with sqlite3.connect(path) as con:
+        con.executescript(_DISK_CACHE_SQL)
+    clear_cache()
+    load_jumps(path)
+    ((_fid, con, _immutable),) = data_loader._conn_cache.values()
+    # Preference update callback (also run from data_ops.unregister via clear_cache)
+    _on_db_path_update(None, None)
+    assert not data_loader._conn_cache
+    with pytest.raises(sqlite3.ProgrammingError):
+        con.execute("SELECT 1")  # handle released
+    path.unlink()  # file is no longer held open
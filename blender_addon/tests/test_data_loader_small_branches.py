@@ -48,6 +48,32 @@ def test_region_fk_but_no_region_table():
     assert s.constellation_name == "C-Alpha"
 
 
+def test_region_fk_with_region_tables_absent():
+    # FK columns exist but neither lookup table does: names fall back to None
+    sql = """
+    CREATE TABLE SolarSystems (
+        solarSystemId INTEGER PRIMARY KEY,
+        name TEXT,
+        centerX REAL,
+        centerY REAL,
+        centerZ REAL,
+        regionId INTEGER,
+        constellationId INTEGER
+    );
+    CREATE TABLE Planets (planetId INTEGER PRIMARY KEY, solarSystemId INTEGER, planetName TEXT);
+    CREATE TABLE Moons (moonId INTEGER PRIMARY KEY, planetId INTEGER, moonName TEXT);
+    CREATE TABLE Jumps (fromSystemId INTEGER, toSystemId INTEGER);
+    CREATE TABLE NpcStations (stationId INTEGER PRIMARY KEY, solarSystemId INTEGER);
+
+    INSERT INTO SolarSystems VALUES (1, 'Orphan', 0,0,0, 10, 20);
+    """
+    path = make_tmp_db(sql)
+    systems = load_data(path, enable_cache=False)
+    assert len(systems) == 1
+    assert systems[0].region_name is None
+    assert systems[0].constellation_name is None
+
+
 def test_empty_systems_cached_empty():
     sql = """
     CREATE TABLE SolarSystems (solarSystemId INTEGER PRIMARY KEY, name TEXT, centerX REAL, centerY REAL, centerZ REAL);
@@ -62,3 +88,27 @@ def test_empty_systems_cached_empty():
     assert s1 == []
     s2 = load_data(path)
     assert s1 is s2
+
+
+def test_moon_count_when_planet_rows_split_by_affinity():
+    # Untyped planetId keeps '10' as TEXT, so SQL orders it after the INTEGER 10 and 11 rows
+    # and planet 10 arrives in two groupby runs
+    sql = """
+    CREATE TABLE SolarSystems (solarSystemId INTEGER PRIMARY KEY, name TEXT, centerX REAL, centerY REAL, centerZ REAL);
+    CREATE TABLE Planets (planetId INTEGER PRIMARY KEY, solarSystemId INTEGER, planetName TEXT);
+    CREATE TABLE Moons (moonId INTEGER PRIMARY KEY, planetId, moonName TEXT);
+    CREATE TABLE Jumps (fromSystemId INTEGER, toSystemId INTEGER);
+    CREATE TABLE NpcStations (stationId INTEGER PRIMARY KEY, solarSystemId INTEGER);
+
+    INSERT INTO SolarSystems VALUES (1, 'S1', 0,0,0);
+    INSERT INTO Planets VALUES (10, 1, 'P1');
+    INSERT INTO Planets VALUES (11, 1, 'P2');
+    INSERT INTO Moons VALUES (100, 10, 'M1');
+    INSERT INTO Moons VALUES (101, '10', 'M2');
+    INSERT INTO Moons VALUES (102, 10, 'M3');
+    INSERT INTO Moons VALUES (103, 11, 'M4');
+    """
+    path = make_tmp_db(sql)
+    (system,) = load_data(path, enable_cache=False)
+    assert [len(p.moons) for p in system.planets] == [3, 1]
+    assert system.moon_count == 4
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from addon.operators.property_calculators import (
     calculate_char_indices,
-    calculate_child_metrics,
     calculate_name_char_bucket,
     calculate_name_pattern_category,
+    filter_excluded_systems,
     is_blackhole_system,
 )
 
@@ -173,29 +173,6 @@ class TestNameCharBucket:
         assert calculate_name_char_bucket("@System") == -1
 
 
-class TestChildMetrics:
-    """Test planet/moon counting."""
-
-    def test_no_planets(self):
-        assert calculate_child_metrics([]) == (0, 0)
-
-    def test_planets_no_moons(self):
-        class Planet:
-            def __init__(self):
-                self.moons = []
-
-        planets = [Planet(), Planet(), Planet()]
-        assert calculate_child_metrics(planets) == (3, 0)
-
-    def test_planets_with_moons(self):
-        class Planet:
-            def __init__(self, moon_count):
-                self.moons = [None] * moon_count
-
-        planets = [Planet(2), Planet(5), Planet(0), Planet(3)]
-        assert calculate_child_metrics(planets) == (4, 10)
-
-
 class TestBlackholeDetection:
     """Test blackhole system detection."""
 
@@ -210,3 +187,35 @@ class TestBlackholeDetection:
         assert is_blackhole_system(30000000) is False
         assert is_blackhole_system(32000001) is False  # AD system
         assert is_blackhole_system(1) is False
+
+
+class TestExclusionFilter:
+    """Test build-time name exclusions."""
+
+    class System:
+        def __init__(self, name):
+            self.name = name
+
+    def _names(self, systems):
+        return [s.name for s in systems]
+
+    def test_no_exclusions_returns_copy(self):
+        systems = [self.System("AD001"), self.System("Nod")]
+        kept = filter_excluded_systems(systems)
+        assert kept == systems
+        assert kept is not systems
+
+    def test_exclude_ad_only(self):
+        systems = [self.System(n) for n in ("AD001", "ad123", "V-001", "AD12", "Nod")]
+        kept = filter_excluded_systems(systems, exclude_ad=True)
+        assert self._names(kept) == ["V-001", "AD12", "Nod"]
+
+    def test_exclude_vdash_only(self):
+        systems = [self.System(n) for n in ("AD001", "V-001", " v-999 ", "V-1000")]
+        kept = filter_excluded_systems(systems, exclude_vdash=True)
+        assert self._names(kept) == ["AD001", "V-1000"]
+
+    def test_exclude_both_handles_missing_names(self):
+        systems = [self.System(n) for n in ("AD001", "V-001", None, "A 2560")]
+        kept = filter_excluded_systems(systems, exclude_ad=True, exclude_vdash=True)
+        assert self._names(kept) == [None, "A 2560"]
@@ -0,0 +1,32 @@
+import math
+
+import pytest
+
+from addon.operators.viewport import _fit_view_distance
+
+
+def test_perspective_fit_uses_smaller_region_side():
+    # 50 mm lens in a 16:9 region: vertical half-FOV is ~22 degrees, not 35.75
+    dist = _fit_view_distance(1.0, 50.0, 1920, 1080)
+    half_fov = math.atan(72.0 / 100.0 * 1080 / 1920)
+    assert math.degrees(half_fov) == pytest.approx(22.05, abs=0.01)
+    assert dist == pytest.approx(1.0 / math.sin(half_fov))
+    assert dist == pytest.approx(2.67, abs=0.01)
+
+
+def test_perspective_fit_is_orientation_independent():
+    assert _fit_view_distance(5.0, 50.0, 1080, 1920) == pytest.approx(
+        _fit_view_distance(5.0, 50.0, 1920, 1080)
+    )
+
+
+def test_square_or_unknown_region_uses_full_sensor():
+    expected = 1.0 / math.sin(math.atan(72.0 / 100.0))
+    assert _fit_view_distance(1.0, 50.0, 800, 800) == pytest.approx(expected)
+    assert _fit_view_distance(1.0, 50.0, 0, 0) == pytest.approx(expected)
+
+
+def test_orthographic_fit_scales_half_extent():
+    # Ortho half-extent on the smaller side is distance * tan_half
+    dist = _fit_view_distance(2.0, 50.0, 1920, 1080, perspective=False)
+    assert dist * (72.0 / 100.0) * (1080 / 1920) == pytest.approx(2.0)